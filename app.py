@@ -3,16 +3,23 @@ Sidecar — A personal overlay dashboard for Linear tickets.
 Flask backend: read-only Linear API, local overlay files for notes/priority/status.
 """
 
-import copy
+import contextlib
+import functools
 import json
 import logging
 import os
 import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import requests
 from dotenv import load_dotenv
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson is not installed
+    orjson = None
 from flask import Flask, jsonify, render_template, request
 
 import metrics as metrics_module
@@ -44,6 +51,10 @@ OVERLAY_PATH = _data_dir / "overlay.json"
 METRICS_STORE_PATH = _data_dir / "metrics_store.json"
 PAGE_SIZE = 50
 
+_UTC = timezone.utc
+# Sort key for issues whose future cycle has no parseable start date (sorts last).
+_FAR_FUTURE = datetime.max.replace(tzinfo=_UTC)
+
 metrics_module.METRICS_STORE_PATH = METRICS_STORE_PATH
 
 # In-memory cache: list of merged issue dicts, and when we last fetched from Linear.
@@ -102,16 +113,65 @@ COLUMN_REGISTRY = [
     {"id": "labels", "label": "Labels", "default_visible": False, "sortable": True, "sort_type": "alpha", "filterable": True, "filter_type": "multiselect", "linear_field": "labels"},
 ]
 DEFAULT_COLUMN_ORDER = [c["id"] for c in COLUMN_REGISTRY]
+# Read-only id -> default_visible map; copy with dict(...) before handing it out or mutating.
+DEFAULT_COLUMN_VISIBILITY = types.MappingProxyType({c["id"]: c["default_visible"] for c in COLUMN_REGISTRY})
 _REGISTRY_IDS = frozenset(c["id"] for c in COLUMN_REGISTRY)
 RESERVED_KEYS = (COLUMN_VISIBILITY_KEY, COLUMN_PREFERENCES_KEY)
 
 
+def _json_loads(raw):
+    """Parse JSON bytes with orjson when available, else stdlib json. Raises json.JSONDecodeError on bad input."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # orjson is stricter than stdlib json (e.g. lone-surrogate escapes); let json decide
+    return json.loads(raw)
+
+
+def _json_dumps_bytes(data):
+    """Serialize data as indent=2 JSON bytes with orjson when available, else stdlib json."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints beyond 64 bits or lone surrogates, which stdlib json still serializes
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _read_json_file(path):
+    """Return parsed JSON from path; empty dict if missing or unreadable."""
+    if not path.exists():
+        return {}
+    try:
+        return _json_loads(path.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+        return {}
+
+
+def _write_json_file(path, data):
+    """Serialize data (indent=2) to bytes up front and write it to path atomically: one write to a
+    sibling temp file, fsync, then os.replace, so readers never see a truncated file."""
+    payload = _json_dumps_bytes(data)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        # Unbuffered: the payload goes straight to write(2) instead of being copied through BufferedWriter
+        with open(tmp, "wb", buffering=0) as f:
+            view = memoryview(payload)
+            while view:
+                view = view[f.write(view):]
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 def _migrate_files_to_subdirs():
     """Move data files from the old root layout into config/ and data/ subdirectories.
     Idempotent — skips any file whose destination already exists.
     Must run before _migrate_overlay_to_split so that function finds files in the right place."""
-    _config_dir.mkdir(exist_ok=True)
-    _data_dir.mkdir(exist_ok=True)
+    _ensure_data_dirs()
 
     moves = [
         (_app_dir / "settings.json",      SETTINGS_PATH),
@@ -130,18 +190,13 @@ def _migrate_files_to_subdirs():
 def _migrate_overlay_to_split():
     """One-time migration: overlay.json -> settings.json + inprogress.json + completed.json; rename overlay.json to overlay.old.
     Idempotent: only runs when SETTINGS_PATH does not exist."""
-    _config_dir.mkdir(exist_ok=True)
-    _data_dir.mkdir(exist_ok=True)
+    _ensure_data_dirs()
     if SETTINGS_PATH.exists():
         return
     if OVERLAY_LEGACY_PATH.exists():
-        try:
-            with open(OVERLAY_LEGACY_PATH, "r", encoding="utf-8") as f:
-                raw = json.load(f)
-        except (json.JSONDecodeError, OSError):
-            raw = {}
+        raw = _read_json_file(OVERLAY_LEGACY_PATH)
         # Build settings: column_preferences only (migrate legacy column_visibility)
-        default_vis = {c["id"]: c["default_visible"] for c in COLUMN_REGISTRY}
+        default_vis = dict(DEFAULT_COLUMN_VISIBILITY)
         prefs = raw.get(COLUMN_PREFERENCES_KEY)
         if isinstance(prefs, dict) and isinstance(prefs.get("order"), list) and isinstance(prefs.get("visibility"), dict):
             if _valid_column_order(prefs["order"]):
@@ -156,81 +211,92 @@ def _migrate_overlay_to_split():
                 settings = {COLUMN_PREFERENCES_KEY: {"order": list(DEFAULT_COLUMN_ORDER), "visibility": merged_vis}}
             else:
                 settings = {COLUMN_PREFERENCES_KEY: {"order": list(DEFAULT_COLUMN_ORDER), "visibility": default_vis}}
-        with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=2)
+        _write_json_file(SETTINGS_PATH, settings)
         # Issue entries -> inprogress; completed empty
         inprogress = {k: v for k, v in raw.items() if k not in RESERVED_KEYS and isinstance(v, dict)}
-        with open(INPROGRESS_PATH, "w", encoding="utf-8") as f:
-            json.dump(inprogress, f, indent=2)
-        with open(COMPLETED_PATH, "w", encoding="utf-8") as f:
-            json.dump({}, f, indent=2)
+        _write_json_file(INPROGRESS_PATH, inprogress)
+        _write_json_file(COMPLETED_PATH, {})
         OVERLAY_LEGACY_PATH.rename(OVERLAY_OLD_PATH)
     else:
-        default_vis = {c["id"]: c["default_visible"] for c in COLUMN_REGISTRY}
+        default_vis = dict(DEFAULT_COLUMN_VISIBILITY)
         settings = {COLUMN_PREFERENCES_KEY: {"order": list(DEFAULT_COLUMN_ORDER), "visibility": default_vis}}
-        with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=2)
-        with open(INPROGRESS_PATH, "w", encoding="utf-8") as f:
-            json.dump({}, f, indent=2)
-        with open(COMPLETED_PATH, "w", encoding="utf-8") as f:
-            json.dump({}, f, indent=2)
+        _write_json_file(SETTINGS_PATH, settings)
+        _write_json_file(INPROGRESS_PATH, {})
+        _write_json_file(COMPLETED_PATH, {})
+
+
+def _ensure_data_dirs():
+    """Create the directories holding the settings and overlay files (config/ and data/ by default)."""
+    for d in {SETTINGS_PATH.parent, INPROGRESS_PATH.parent, COMPLETED_PATH.parent}:
+        d.mkdir(parents=True, exist_ok=True)
+
+
+# Path set for which ensure_migrated has already run the migrations; lets hot paths skip the legacy-file sweep.
+_migrated_paths = None
 
 
 def ensure_migrated():
     """Ensure correct directory layout exists; run one-time migrations if needed."""
+    global _migrated_paths
+    _ensure_data_dirs()
+    paths = (SETTINGS_PATH, INPROGRESS_PATH, COMPLETED_PATH, OVERLAY_LEGACY_PATH, OVERLAY_OLD_PATH)
+    if _migrated_paths == paths and SETTINGS_PATH.exists():
+        return
     _migrate_files_to_subdirs()
     _migrate_overlay_to_split()
+    _migrated_paths = paths
 
 
 def read_settings():
     """Return settings dict from settings.json. Empty dict if missing. No migration (call ensure_migrated first)."""
-    if not SETTINGS_PATH.exists():
-        return {}
-    try:
-        with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        return {}
+    return _read_json_file(SETTINGS_PATH)
 
 
 def write_settings(settings_dict):
     """Write settings dict to settings.json."""
-    with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
-        json.dump(settings_dict, f, indent=2)
+    _write_json_file(SETTINGS_PATH, settings_dict)
 
 
 def read_inprogress_overlay():
     """Return inprogress overlay dict (issue_id -> entry). Empty if file missing. No migration."""
-    if not INPROGRESS_PATH.exists():
-        return {}
-    try:
-        with open(INPROGRESS_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        return {}
+    return _read_json_file(INPROGRESS_PATH)
 
 
 def read_completed_overlay():
     """Return completed overlay dict (issue_id -> entry). Empty if file missing. No migration."""
-    if not COMPLETED_PATH.exists():
-        return {}
-    try:
-        with open(COMPLETED_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        return {}
+    return _read_json_file(COMPLETED_PATH)
 
 
 def write_inprogress_overlay(overlay):
     """Write inprogress overlay dict to inprogress.json."""
-    with open(INPROGRESS_PATH, "w", encoding="utf-8") as f:
-        json.dump(overlay, f, indent=2)
+    _write_json_file(INPROGRESS_PATH, overlay)
 
 
 def write_completed_overlay(overlay):
     """Write completed overlay dict to completed.json."""
-    with open(COMPLETED_PATH, "w", encoding="utf-8") as f:
-        json.dump(overlay, f, indent=2)
+    _write_json_file(COMPLETED_PATH, overlay)
+
+
+def _clone_overlay(overlay):
+    """Copy an overlay two levels deep (top dict + each entry dict). Issue entries hold only JSON scalars,
+    so this is equivalent to a deepcopy for them at a fraction of the cost."""
+    return {k: (dict(v) if isinstance(v, dict) else v) for k, v in overlay.items()}
+
+
+@contextlib.contextmanager
+def overlay_transaction():
+    """Read inprogress.json and completed.json once and yield (inprog, completed) for in-place edits.
+    On normal exit each file is written back once, and only if its contents changed; nothing is written if the block raises."""
+    ensure_migrated()
+    inprog = read_inprogress_overlay()
+    completed = read_completed_overlay()
+    inprog_before = _clone_overlay(inprog)
+    completed_before = _clone_overlay(completed)
+    yield inprog, completed
+    if inprog != inprog_before:
+        write_inprogress_overlay(inprog)
+    if completed != completed_before:
+        write_completed_overlay(completed)
 
 
 def read_issue_overlay():
@@ -336,29 +402,30 @@ def _fetch_all_assigned_issues(token, *, for_backfill: bool = False):
     for_backfill=True: include every issue Linear returns for assignee isMe (no date cutoff),
     so older completed work still assigned to you is included for dwell history import.
     """
-    six_months_ago = datetime.now(timezone.utc) - timedelta(days=180)
+    six_months_ago = datetime.now(_UTC) - timedelta(days=180)
     all_nodes = []
-    after = None
-    while True:
-        page = _fetch_issues_page(token, after_cursor=after)  # no viewer_id: filter uses isMe in query
-        nodes = page["nodes"]
-        for n in nodes:
-            if for_backfill:
-                all_nodes.append(n)
-                continue
-            state_type = (n.get("state") or {}).get("type")
-            is_completed = state_type in ("completed", "canceled")
-            updated_at = n.get("updatedAt")
-            try:
-                updated_dt = datetime.fromisoformat(updated_at.replace("Z", "+00:00")) if updated_at else None
-            except (ValueError, AttributeError):
-                updated_dt = None
-            # Include: active (not completed), or completed/canceled updated in last 6 months
-            if not is_completed or (updated_dt and updated_dt.tzinfo and updated_dt >= six_months_ago):
-                all_nodes.append(n)
-        if not page["pageInfo"]["hasNextPage"]:
-            break
-        after = page["pageInfo"]["endCursor"]
+    # Prefetch: request page N+1 as soon as its cursor is known, then filter page N while it is in flight.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(_fetch_issues_page, token)  # no viewer_id: filter uses isMe in query
+        while pending is not None:
+            page = pending.result()
+            pending = None
+            if page["pageInfo"]["hasNextPage"]:
+                pending = pool.submit(_fetch_issues_page, token, after_cursor=page["pageInfo"]["endCursor"])
+            for n in page["nodes"]:
+                if for_backfill:
+                    all_nodes.append(n)
+                    continue
+                state_type = (n.get("state") or {}).get("type")
+                is_completed = state_type in ("completed", "canceled")
+                updated_at = n.get("updatedAt")
+                try:
+                    updated_dt = datetime.fromisoformat(updated_at.replace("Z", "+00:00")) if updated_at else None
+                except (ValueError, AttributeError):
+                    updated_dt = None
+                # Include: active (not completed), or completed/canceled updated in last 6 months
+                if not is_completed or (updated_dt and updated_dt.tzinfo and updated_dt >= six_months_ago):
+                    all_nodes.append(n)
     return all_nodes
 
 
@@ -554,20 +621,24 @@ def get_column_preferences():
         vis = prefs.get("visibility")
         if isinstance(order, list) and isinstance(vis, dict):
             if _valid_column_order(order):
-                default_vis = {c["id"]: c["default_visible"] for c in COLUMN_REGISTRY}
-                merged_vis = {**default_vis, **{k: bool(v) for k, v in vis.items() if k in default_vis}}
+                merged_vis = {**DEFAULT_COLUMN_VISIBILITY, **{k: bool(v) for k, v in vis.items() if k in _REGISTRY_IDS}}
                 return {"order": list(order), "visibility": merged_vis}
     return {
         "order": list(DEFAULT_COLUMN_ORDER),
-        "visibility": {c["id"]: c["default_visible"] for c in COLUMN_REGISTRY},
+        "visibility": dict(DEFAULT_COLUMN_VISIBILITY),
     }
 
 
 def write_column_preferences(order_list, visibility_dict):
-    """Write column_preferences to settings.json only."""
+    """Write column_preferences to settings.json only. Raises ValueError unless order_list holds every
+    registry ID exactly once; visibility keys outside the registry are dropped."""
+    order = list(order_list)
+    if not _valid_column_order(order):
+        raise ValueError("order must contain every column ID exactly once")
     ensure_migrated()
     settings = read_settings()
-    settings[COLUMN_PREFERENCES_KEY] = {"order": list(order_list), "visibility": dict(visibility_dict)}
+    vis = {k: v for k, v in visibility_dict.items() if k in _REGISTRY_IDS}
+    settings[COLUMN_PREFERENCES_KEY] = {"order": order, "visibility": vis}
     write_settings(settings)
 
 
@@ -617,37 +688,34 @@ def write_site_settings(updates):
     return merged
 
 
+def _now_iso():
+    """Current UTC time as the overlay's last_updated string (YYYY-MM-DDTHH:MM:SS, no offset)."""
+    return datetime.now(_UTC).replace(tzinfo=None).isoformat(timespec="seconds")
+
+
 def write_overlay_entry(issue_id, data, is_completed=None):
     """Update overlay with one entry; write to inprogress or completed based on is_completed.
     data: personal_priority, personal_status, notes. personal_priority is stripped when is_completed is True."""
-    ensure_migrated()
     key = _overlay_key(issue_id)
     if not key:
         return None
-    inprog = read_inprogress_overlay()
-    completed = read_completed_overlay()
-    entry = (inprog.get(key) or completed.get(key) or {}).copy()
-    if "personal_priority" in data:
-        entry["personal_priority"] = data["personal_priority"] if not is_completed else None
-    if "personal_status" in data:
-        entry["personal_status"] = data.get("personal_status", "")
-    if "notes" in data:
-        entry["notes"] = data.get("notes", "")
-    entry["last_updated"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
-    if is_completed:
-        entry_clean = {k: v for k, v in entry.items() if k != "personal_priority"}
-        if key in inprog:
-            inprog = {k: v for k, v in inprog.items() if k != key}
-            write_inprogress_overlay(inprog)
-        completed[key] = entry_clean
-        write_completed_overlay(completed)
-    else:
-        if key in completed:
-            completed = {k: v for k, v in completed.items() if k != key}
-            write_completed_overlay(completed)
-        inprog[key] = entry
-        write_inprogress_overlay(inprog)
-    return entry if not is_completed else {k: v for k, v in entry.items() if k != "personal_priority"}
+    with overlay_transaction() as (inprog, completed):
+        entry = (inprog.get(key) or completed.get(key) or {}).copy()
+        if "personal_priority" in data:
+            entry["personal_priority"] = data["personal_priority"] if not is_completed else None
+        if "personal_status" in data:
+            entry["personal_status"] = data.get("personal_status", "")
+        if "notes" in data:
+            entry["notes"] = data.get("notes", "")
+        entry["last_updated"] = _now_iso()
+        if is_completed:
+            entry = {k: v for k, v in entry.items() if k != "personal_priority"}
+            inprog.pop(key, None)
+            completed[key] = entry
+        else:
+            completed.pop(key, None)
+            inprog[key] = entry
+    return entry
 
 
 def _overlay_key(issue_id):
@@ -659,6 +727,51 @@ def _overlay_key(issue_id):
     return s
 
 
+def _assign_priority_in_place(overlay, key, n):
+    """Set personal_priority n on overlay[key], shifting others so the list stays contiguous.
+    If n is taken, only the contiguous run starting at n moves down by one (the walk stops at the first free slot).
+    Mutates overlay and its entry dicts; key and n (int >= 1) must already be validated."""
+    entry = overlay.setdefault(key, {})
+    old_priority = entry.get("personal_priority")
+    holders = {}  # priority -> keys holding it (a list, so pre-existing duplicates move together)
+    for k, v in overlay.items():
+        if k == key or k in RESERVED_KEYS:
+            continue
+        p = v.get("personal_priority")
+        if p is not None:
+            holders.setdefault(p, []).append(k)
+    if n in holders:
+        run = []
+        p = n
+        while p in holders:
+            run.extend(holders[p])
+            p += 1
+        for k in run:
+            overlay[k]["personal_priority"] += 1
+    elif old_priority is not None and old_priority != n:
+        for p, keys in holders.items():
+            if p > old_priority:
+                for k in keys:
+                    overlay[k]["personal_priority"] = p - 1
+    entry["personal_priority"] = n
+
+
+def _remove_priority_in_place(overlay, key):
+    """Drop personal_priority from overlay[key] and decrement everyone above it. No-op if key has none.
+    Mutates overlay and its entry dicts."""
+    entry = overlay.get(key)
+    removed = entry.get("personal_priority") if entry else None
+    if removed is None:
+        return
+    del entry["personal_priority"]
+    for k, v in overlay.items():
+        if k in RESERVED_KEYS:
+            continue
+        p = v.get("personal_priority")
+        if p is not None and p > removed:
+            v["personal_priority"] = p - 1
+
+
 def rebalance_overlay_after_assign(overlay, issue_id, new_priority):
     """Pure: assign personal_priority N to issue_id. If N is taken, shift existing >= N down by 1.
     Returns a new overlay dict; does not mutate input. No I/O."""
@@ -671,55 +784,18 @@ def rebalance_overlay_after_assign(overlay, issue_id, new_priority):
         return overlay
     if n < 1:
         return overlay
-    out = copy.deepcopy(overlay)
-    if key not in out:
-        out[key] = {}
-    entry = out[key]
-    old_priority = entry.get("personal_priority")
-    _reserved = (COLUMN_VISIBILITY_KEY, COLUMN_PREFERENCES_KEY)
-    someone_else_has_n = any(
-        k != key and k not in _reserved and (out[k].get("personal_priority")) == n
-        for k in out
-    )
-    if someone_else_has_n:
-        for k in out:
-            if k in _reserved:
-                continue
-            p = out[k].get("personal_priority")
-            if p is not None and p >= n:
-                out[k] = {**out[k], "personal_priority": p + 1}
-        out[key] = {**entry, "personal_priority": n}
-    else:
-        out[key] = {**entry, "personal_priority": n}
-        if old_priority is not None and old_priority != n:
-            for k in out:
-                if k == key or k in _reserved:
-                    continue
-                p = out[k].get("personal_priority")
-                if p is not None and p > old_priority:
-                    out[k] = {**out[k], "personal_priority": p - 1}
+    out = _clone_overlay(overlay)
+    _assign_priority_in_place(out, key, n)
     return out
 
 
 def rebalance_overlay_after_remove(overlay, issue_id):
     """Pure: remove personal_priority for issue_id; decrement everyone above so list stays contiguous.
     Returns a new overlay dict; does not mutate input. No I/O."""
+    out = _clone_overlay(overlay)
     key = _overlay_key(issue_id)
-    if not key or key not in overlay:
-        return copy.deepcopy(overlay)
-    entry = overlay[key]
-    removed = entry.get("personal_priority")
-    if removed is None:
-        return copy.deepcopy(overlay)
-    _reserved = (COLUMN_VISIBILITY_KEY, COLUMN_PREFERENCES_KEY)
-    out = copy.deepcopy(overlay)
-    out[key] = {k: v for k, v in entry.items() if k != "personal_priority"}
-    for k in out:
-        if k in _reserved:
-            continue
-        p = out[k].get("personal_priority")
-        if p is not None and p > removed:
-            out[k] = {**out[k], "personal_priority": p - 1}
+    if key:
+        _remove_priority_in_place(out, key)
     return out
 
 
@@ -729,25 +805,27 @@ def rebalance_overlay_after_remove_multiple(overlay, issue_ids):
     keys = [_overlay_key(i) for i in issue_ids]
     keys = [k for k in keys if k and k in overlay]
     if not keys:
-        return copy.deepcopy(overlay)
+        return _clone_overlay(overlay)
     # Sort by current priority (ascending) so we remove from bottom up and don't shift wrong
     with_priority = [(k, overlay[k].get("personal_priority")) for k in keys if overlay[k].get("personal_priority") is not None]
     with_priority.sort(key=lambda x: (x[1] or 0))
-    out = copy.deepcopy(overlay)
+    out = _clone_overlay(overlay)
     for k, _ in with_priority:
-        removed = out.get(k, {}).get("personal_priority")
-        if removed is None:
-            continue
-        out[k] = {kk: vv for kk, vv in out[k].items() if kk != "personal_priority"}
-        for kk in out:
-            if kk in (COLUMN_VISIBILITY_KEY, COLUMN_PREFERENCES_KEY):
-                continue
-            p = out[kk].get("personal_priority")
-            if p is not None and p > removed:
-                out[kk] = {**out[kk], "personal_priority": p - 1}
+        _remove_priority_in_place(out, k)
     return out
 
 
+def _has_duplicate_priority(entries_with_priority):
+    """True if any two (key, entry) pairs share a personal_priority. Stops at the first repeat."""
+    seen = set()
+    for _, v in entries_with_priority:
+        p = v["personal_priority"]
+        if p in seen:
+            return True
+        seen.add(p)
+    return False
+
+
 def resolve_priority_conflicts(overlay):
     """Pure: if duplicate personal_priority values exist, reassign contiguous 1,2,3 by last_updated desc.
     Returns a new overlay dict; does not mutate input. No I/O. Skips reserved keys."""
@@ -757,44 +835,50 @@ def resolve_priority_conflicts(overlay):
         if k not in _reserved and isinstance(v, dict) and v.get("personal_priority") is not None
     ]
     if not entries_with_priority:
-        return copy.deepcopy(overlay)
-    priorities = {v.get("personal_priority") for _, v in entries_with_priority}
-    if len(priorities) == len(entries_with_priority):
-        return copy.deepcopy(overlay)
-    # Duplicates: sort by last_updated desc, reassign 1, 2, 3, ...
+        return _clone_overlay(overlay)
+    if not _has_duplicate_priority(entries_with_priority):
+        return _clone_overlay(overlay)
+    # Duplicates: sort by last_updated desc, reassign 1, 2, 3, ... (one sort; no per-priority rescans)
     sorted_entries = sorted(
         entries_with_priority,
         key=lambda x: (x[1].get("last_updated") or ""),
         reverse=True,
     )
-    out = copy.deepcopy(overlay)
-    for i, (k, v) in enumerate(sorted_entries, 1):
-        out[k] = {**out[k], "personal_priority": i}
+    out = _clone_overlay(overlay)
+    for i, (k, _) in enumerate(sorted_entries, 1):
+        out[k]["personal_priority"] = i
     return out
 
 
+_EMPTY_OVERLAY_ENTRY = types.MappingProxyType({})
+
+
 def merge_issues(linear_issues, overlay):
     """Merge Linear issues with overlay; return list of merged dicts with defaults for missing overlay."""
-    result = []
-    for issue in linear_issues:
-        merged = dict(issue)
+    result = [None] * len(linear_issues)
+    overlay_get = overlay.get
+    for i, issue in enumerate(linear_issues):
         key = issue.get("identifier") or issue.get("id")
-        entry = overlay.get(key, {}) if key else {}
-        merged["personal_priority"] = entry.get("personal_priority")
-        merged["personal_status"] = entry.get("personal_status", "")
-        merged["notes"] = entry.get("notes", "")
-        merged["last_updated"] = entry.get("last_updated")
-        result.append(merged)
+        entry = overlay_get(key, _EMPTY_OVERLAY_ENTRY) if key else _EMPTY_OVERLAY_ENTRY
+        result[i] = {
+            **issue,
+            "personal_priority": entry.get("personal_priority"),
+            "personal_status": entry.get("personal_status", ""),
+            "notes": entry.get("notes", ""),
+            "last_updated": entry.get("last_updated"),
+        }
     return result
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_iso_date(iso_str):
-    """Parse ISO date string to datetime in UTC; return None if invalid."""
+    """Parse ISO date string to datetime in UTC; return None if invalid.
+    Memoized: cycle start/end and updatedAt strings repeat across issues and sort/filter passes."""
     if not iso_str:
         return None
     try:
         s = (iso_str or "").replace("Z", "+00:00")
-        return datetime.fromisoformat(s).astimezone(timezone.utc)
+        return datetime.fromisoformat(s).astimezone(_UTC)
     except (ValueError, AttributeError):
         return None
 
@@ -853,10 +937,10 @@ def _sort_within_cycle_group(issues):
 
 def sort_issues_by_cycle(issues, now_utc=None):
     """Sort merged issues by Cycle order: Urgent → Personal priority → Current cycle → Future cycles → No cycle.
-    Pure function: no I/O. now_utc defaults to datetime.now(timezone.utc) for testing can inject a fixed time.
+    Pure function: no I/O. now_utc defaults to datetime.now(_UTC) for testing can inject a fixed time.
     """
     if now_utc is None:
-        now_utc = datetime.now(timezone.utc)
+        now_utc = datetime.now(_UTC)
     now_date = now_utc.date() if hasattr(now_utc, "date") else now_utc
 
     urgent = []
@@ -888,7 +972,7 @@ def sort_issues_by_cycle(issues, now_utc=None):
     # Future cycles: sort by cycle start (nearest first), then within cycle by status then priority
     def future_sort_key(i):
         c = i.get("cycle") or {}
-        start = _parse_iso_date(c.get("starts_at")) or datetime.max.replace(tzinfo=timezone.utc)
+        start = _parse_iso_date(c.get("starts_at")) or _FAR_FUTURE
         return (start, _status_sort_key(i.get("linear_status")), _linear_priority_sort_key(i.get("linear_priority")))
     future_cycle.sort(key=future_sort_key)
     no_cycle.sort(key=lambda i: (i.get("updated_at") or ""), reverse=True)
@@ -898,8 +982,6 @@ def sort_issues_by_cycle(issues, now_utc=None):
 
 def _apply_filter(issues, filter_val):
     """Filter issues by active/completed. filter_val: 'active' | 'completed' | None (all)."""
-    if not filter_val:
-        return list(issues)
     if filter_val == "active":
         return [i for i in issues if not i.get("is_completed")]
     if filter_val == "completed":
@@ -907,6 +989,16 @@ def _apply_filter(issues, filter_val):
     return list(issues)
 
 
+def _parse_filter_date(value):
+    """Parse a date_from/date_to filter bound to a date; None if missing or invalid."""
+    if value is None:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).date()
+    except (ValueError, AttributeError):
+        return None
+
+
 def apply_issue_filters(issues, filter_config):
     """Filter issues by date range, Linear status/priority, personal priority set/unset, personal status.
     filter_config: dict with date_from, date_to (ISO date or None), linear_statuses (list of str),
@@ -919,25 +1011,18 @@ def apply_issue_filters(issues, filter_config):
     date_from = cfg.get("date_from")
     date_to = cfg.get("date_to")
     if date_from is not None or date_to is not None:
+        # Parse the bounds once; an unparseable bound is ignored (as before), not treated as excluding everything.
+        from_d = _parse_filter_date(date_from)
+        to_d = _parse_filter_date(date_to)
         def in_date_range(issue):
             updated = _parse_iso_date(issue.get("updated_at"))
             if not updated:
                 return False
             d = updated.date()
-            if date_from is not None:
-                try:
-                    from_dt = datetime.fromisoformat(date_from.replace("Z", "+00:00")).date()
-                    if d < from_dt:
-                        return False
-                except (ValueError, AttributeError):
-                    pass
-            if date_to is not None:
-                try:
-                    to_dt = datetime.fromisoformat(date_to.replace("Z", "+00:00")).date()
-                    if d > to_dt:
-                        return False
-                except (ValueError, AttributeError):
-                    pass
+            if from_d is not None and d < from_d:
+                return False
+            if to_d is not None and d > to_d:
+                return False
             return True
         result = [i for i in result if in_date_range(i)]
     linear_statuses = cfg.get("linear_statuses") or []
@@ -1118,7 +1203,7 @@ def get_cached_issues():
         _record_metrics_after_linear_fetch(linear, force_github=False)
         overlay = read_overlay()
         _issues_cache = merge_issues(linear, overlay)
-        _last_fetched = datetime.now(timezone.utc).isoformat()
+        _last_fetched = datetime.now(_UTC).isoformat()
     return _issues_cache
 
 
@@ -1160,7 +1245,7 @@ def refresh_cache(force_github: bool = False):
     write_completed_overlay(completed_d)
     overlay = {**inprog, **completed_d}
     _issues_cache = merge_issues(linear, overlay)
-    _last_fetched = datetime.now(timezone.utc).isoformat()
+    _last_fetched = datetime.now(_UTC).isoformat()
     refresh_detail["linear_issue_count"] = len(linear)
     return _issues_cache, refresh_detail
 
@@ -1176,6 +1261,20 @@ def _get_version():
     return ""
 
 
+def _json_resp(obj, status=200):
+    """JSON response for the large issue payloads: serialized once with orjson (no key sort) when
+    available, else through Flask's own JSON provider as jsonify would."""
+    body = None
+    if orjson is not None:
+        try:
+            body = orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            pass  # same stdlib fallback as _json_dumps_bytes
+    if body is None:
+        body = app.json.dumps(obj)
+    return app.response_class(body, status=status, mimetype="application/json")
+
+
 @app.route("/")
 def landing():
     return render_template("index.html", version=_get_version(), nav_active="landing")
@@ -1210,7 +1309,7 @@ def api_issues():
         sort_dir = request.args.get("sort_dir")
         issues = _apply_sort(issues, sort_val, sort_dir)
         last = get_last_fetched()
-        return jsonify({"issues": issues, "last_fetched": last})
+        return _json_resp({"issues": issues, "last_fetched": last})
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
     except requests.HTTPError as e:
@@ -1230,7 +1329,7 @@ def api_refresh():
         force_github = bool(data.get("force_github"))
         issues, refresh_detail = refresh_cache(force_github=force_github)
         last = get_last_fetched()
-        return jsonify({"issues": issues, "last_fetched": last, "refresh_detail": refresh_detail})
+        return _json_resp({"issues": issues, "last_fetched": last, "refresh_detail": refresh_detail})
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
     except requests.HTTPError as e:
@@ -1271,30 +1370,33 @@ def api_overlay_save(issue_id):
         cache = get_cached_issues() if _issues_cache is not None else None
         is_completed = _is_issue_completed(key, data, cache)
         if "personal_priority" in payload and not is_completed:
-            inprog = read_inprogress_overlay()
             pri = payload.get("personal_priority")
-            if pri is None or (isinstance(pri, str) and pri.strip() == ""):
-                new_inprog = rebalance_overlay_after_remove(inprog, issue_id)
-            else:
-                try:
-                    n = int(pri)
-                    if inprog.get(key, {}).get("personal_priority") is not None:
-                        inprog = rebalance_overlay_after_remove(inprog, issue_id)
-                    new_inprog = rebalance_overlay_after_assign(inprog, issue_id, n)
-                except (TypeError, ValueError):
-                    new_inprog = inprog
-            for k in ("personal_status", "notes"):
-                if k in payload:
-                    if key not in new_inprog:
-                        new_inprog[key] = {}
-                    new_inprog[key][k] = payload.get(k, "" if k == "personal_status" else "")
-            new_inprog[key] = new_inprog.get(key, {})
-            new_inprog[key]["last_updated"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
-            write_inprogress_overlay(new_inprog)
+            with overlay_transaction() as (inprog, completed):
+                if pri is None or (isinstance(pri, str) and pri.strip() == ""):
+                    _remove_priority_in_place(inprog, key)
+                else:
+                    try:
+                        n = int(pri)
+                    except (TypeError, ValueError):
+                        n = None
+                    if n is not None:
+                        _remove_priority_in_place(inprog, key)
+                        if n >= 1:
+                            _assign_priority_in_place(inprog, key, n)
+                entry = inprog.setdefault(key, {})
+                for k in ("personal_status", "notes"):
+                    if k in payload:
+                        entry[k] = payload.get(k, "")
+                entry["last_updated"] = _now_iso()
+                resolved = resolve_priority_conflicts(inprog)
+                if resolved != inprog:
+                    logging.warning(
+                        "Overlay had duplicate personal_priority values; auto-resolved and rewrote inprogress.json"
+                    )
+                    inprog.update(resolved)
+                    entry = inprog[key]
             _issues_cache = None
-            entry = new_inprog[key]
-            full_overlay = read_overlay()
-            return jsonify({"ok": True, "entry": entry, "overlay": full_overlay})
+            return jsonify({"ok": True, "entry": entry, "overlay": {**inprog, **completed}})
         entry = write_overlay_entry(issue_id, payload, is_completed=is_completed)
         _issues_cache = None
         return jsonify({"ok": True, "entry": entry})
@@ -1326,10 +1428,6 @@ def api_config_columns_post():
     if not _valid_column_order(order):
         if len(set(order)) != len(order):
             return jsonify({"error": "order must contain each column ID exactly once (no duplicates)"}), 400
-        missing = _REGISTRY_IDS - set(order)
-        extra = set(order) - _REGISTRY_IDS
-        if missing or extra:
-            return jsonify({"error": "order must contain every column ID exactly once"}), 400
         return jsonify({"error": "order must contain every column ID exactly once"}), 400
     current = get_column_preferences()
     merged_vis = {**current["visibility"], **{k: bool(v) for k, v in visibility.items() if k in _REGISTRY_IDS}}
@@ -1,17 +1,23 @@
 """Shared pytest fixtures for overlay split (settings.json, inprogress.json, completed.json)."""
 
-import json
 import pytest
 
 import app as app_module
 import metrics as metrics_module
 
 
+@pytest.fixture(scope="session")
+def client():
+    """One Flask test client for the whole run; TESTING is set once so route exceptions propagate."""
+    app_module.app.testing = True
+    return app_module.app.test_client()
+
+
 @pytest.fixture(autouse=True)
 def reset_app_issues_cache():
-    """Clear in-memory Linear cache between tests (avoids order-dependent failures)."""
-    app_module._issues_cache = None
-    app_module._last_fetched = None
+    """Clear the in-memory Linear cache after every test (avoids order-dependent failures, including under -n auto).
+    Any test can fill it, not only route tests: e.g. test_linear's refresh test calls refresh_cache() directly.
+    The cache starts empty at import, so a teardown-only reset means every test starts clean."""
     yield
     app_module._issues_cache = None
     app_module._last_fetched = None
@@ -27,59 +33,41 @@ def _default_settings():
     }
 
 
+def _patch_overlay_paths(tmp_path, monkeypatch):
+    """Point every overlay path global at tmp_path; monkeypatch restores them after the test."""
+    monkeypatch.setattr(app_module, "SETTINGS_PATH", tmp_path / "settings.json")
+    monkeypatch.setattr(app_module, "INPROGRESS_PATH", tmp_path / "inprogress.json")
+    monkeypatch.setattr(app_module, "COMPLETED_PATH", tmp_path / "completed.json")
+    monkeypatch.setattr(app_module, "OVERLAY_LEGACY_PATH", tmp_path / "overlay.json")
+    monkeypatch.setattr(app_module, "OVERLAY_OLD_PATH", tmp_path / "overlay.old")
+
+
 @pytest.fixture
-def temp_overlay_path(tmp_path):
+def temp_overlay_path(tmp_path, monkeypatch):
     """Patch overlay paths to tmp_path and create split layout (settings, inprogress, completed).
     Use for tests that write/read overlay or column preferences."""
-    orig = (
-        app_module.SETTINGS_PATH,
-        app_module.INPROGRESS_PATH,
-        app_module.COMPLETED_PATH,
-        app_module.OVERLAY_LEGACY_PATH,
-        app_module.OVERLAY_OLD_PATH,
-    )
-    app_module.SETTINGS_PATH = tmp_path / "settings.json"
-    app_module.INPROGRESS_PATH = tmp_path / "inprogress.json"
-    app_module.COMPLETED_PATH = tmp_path / "completed.json"
-    app_module.OVERLAY_LEGACY_PATH = tmp_path / "overlay.json"
-    app_module.OVERLAY_OLD_PATH = tmp_path / "overlay.old"
-    (tmp_path / "settings.json").write_text(json.dumps(_default_settings(), indent=2), encoding="utf-8")
-    (tmp_path / "inprogress.json").write_text("{}", encoding="utf-8")
-    (tmp_path / "completed.json").write_text("{}", encoding="utf-8")
-    yield tmp_path
-    app_module.SETTINGS_PATH = orig[0]
-    app_module.INPROGRESS_PATH = orig[1]
-    app_module.COMPLETED_PATH = orig[2]
-    app_module.OVERLAY_LEGACY_PATH = orig[3]
-    app_module.OVERLAY_OLD_PATH = orig[4]
+    _patch_overlay_paths(tmp_path, monkeypatch)
+    # Seed through the app's own writers: each file lands via temp file + os.replace, never half-written
+    app_module.write_settings(_default_settings())
+    app_module.write_inprogress_overlay({})
+    app_module.write_completed_overlay({})
+    return tmp_path
 
 
 @pytest.fixture
-def temp_overlay_path_no_files(tmp_path):
+def temp_overlay_path_no_files(tmp_path, monkeypatch):
     """Patch overlay paths only; do not create files. Use for test_read_missing_overlay_returns_empty_dict."""
-    orig = (
-        app_module.SETTINGS_PATH,
-        app_module.INPROGRESS_PATH,
-        app_module.COMPLETED_PATH,
-        app_module.OVERLAY_LEGACY_PATH,
-        app_module.OVERLAY_OLD_PATH,
-    )
-    app_module.SETTINGS_PATH = tmp_path / "settings.json"
-    app_module.INPROGRESS_PATH = tmp_path / "inprogress.json"
-    app_module.COMPLETED_PATH = tmp_path / "completed.json"
-    app_module.OVERLAY_LEGACY_PATH = tmp_path / "overlay.json"
-    app_module.OVERLAY_OLD_PATH = tmp_path / "overlay.old"
-    yield tmp_path
-    app_module.SETTINGS_PATH = orig[0]
-    app_module.INPROGRESS_PATH = orig[1]
-    app_module.COMPLETED_PATH = orig[2]
-    app_module.OVERLAY_LEGACY_PATH = orig[3]
-    app_module.OVERLAY_OLD_PATH = orig[4]
+    _patch_overlay_paths(tmp_path, monkeypatch)
+    return tmp_path
 
 
 @pytest.fixture(autouse=True)
-def isolate_metrics_store(tmp_path, monkeypatch):
-    """Avoid writing metrics_store.json into the repo during tests."""
+def isolate_app_data(tmp_path, monkeypatch):
+    """Point every data path (app root for legacy files, overlay split, metrics_store.json) at this test's tmp_path.
+    Tests that never ask for a temp overlay fixture still cannot touch the repo's config/ and data/, and no two
+    tests share a file, so the suite is safe to run in parallel (pytest -n auto)."""
+    monkeypatch.setattr(app_module, "_app_dir", tmp_path)
+    _patch_overlay_paths(tmp_path, monkeypatch)
     mp = tmp_path / "metrics_store.json"
     monkeypatch.setattr(app_module, "METRICS_STORE_PATH", mp)
     monkeypatch.setattr(metrics_module, "METRICS_STORE_PATH", mp)
@@ -1,6 +1,7 @@
 """Unit tests for Linear data parsing and merging logic."""
 
 import pytest
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import patch
 
@@ -176,7 +177,6 @@ def _issue(identifier, linear_priority=2, personal_priority=None, linear_status=
 
 def test_cycle_sort_urgent_always_first():
     """Urgent tickets (linear_priority=1) appear first regardless of personal priority."""
-    from datetime import datetime, timezone
     now = datetime(2025, 2, 10, 12, 0, 0, tzinfo=timezone.utc)
     issues = [
         _issue("LIN-2", linear_priority=2, personal_priority=1),
@@ -190,7 +190,6 @@ def test_cycle_sort_urgent_always_first():
 
 def test_cycle_sort_personal_priority_before_current_cycle():
     """Non-Urgent issues with personal priority appear before current cycle tickets."""
-    from datetime import datetime, timezone
     now = datetime(2025, 2, 10, 12, 0, 0, tzinfo=timezone.utc)
     current_cycle = {"id": "c1", "name": "Current", "number": 1, "starts_at": "2025-02-01T00:00:00Z", "ends_at": "2025-02-28T23:59:59Z"}
     issues = [
@@ -204,7 +203,6 @@ def test_cycle_sort_personal_priority_before_current_cycle():
 
 def test_cycle_sort_current_before_future():
     """Current cycle issues appear before future cycle issues."""
-    from datetime import datetime, timezone
     now = datetime(2025, 2, 10, 12, 0, 0, tzinfo=timezone.utc)
     current = {"id": "c1", "name": "Current", "number": 1, "starts_at": "2025-02-01T00:00:00Z", "ends_at": "2025-02-28T23:59:59Z"}
     future = {"id": "f1", "name": "Future", "number": 2, "starts_at": "2025-03-01T00:00:00Z", "ends_at": "2025-03-14T23:59:59Z"}
@@ -219,7 +217,6 @@ def test_cycle_sort_current_before_future():
 
 def test_cycle_sort_within_cycle_status_order():
     """Within a cycle, status order is In Review → In Progress → Todo."""
-    from datetime import datetime, timezone
     now = datetime(2025, 2, 10, 12, 0, 0, tzinfo=timezone.utc)
     cycle = {"id": "c1", "name": "C", "number": 1, "starts_at": "2025-02-01T00:00:00Z", "ends_at": "2025-02-28T23:59:59Z"}
     issues = [
@@ -234,7 +231,6 @@ def test_cycle_sort_within_cycle_status_order():
 
 def test_cycle_sort_within_status_linear_priority():
     """Within same status, Linear priority order is High → Medium → Low → No priority."""
-    from datetime import datetime, timezone
     now = datetime(2025, 2, 10, 12, 0, 0, tzinfo=timezone.utc)
     cycle = {"id": "c1", "name": "C", "number": 1, "starts_at": "2025-02-01T00:00:00Z", "ends_at": "2025-02-28T23:59:59Z"}
     issues = [
@@ -250,7 +246,6 @@ def test_cycle_sort_within_status_linear_priority():
 
 def test_cycle_sort_no_cycle_at_bottom():
     """Issues with no cycle are last, sorted by updated_at descending."""
-    from datetime import datetime, timezone
     now = datetime(2025, 2, 10, 12, 0, 0, tzinfo=timezone.utc)
     cycle = {"id": "c1", "name": "C", "number": 1, "starts_at": "2025-02-01T00:00:00Z", "ends_at": "2025-02-28T23:59:59Z"}
     issues = [
@@ -266,7 +261,6 @@ def test_cycle_sort_no_cycle_at_bottom():
 
 def test_cycle_sort_future_cycles_chronological():
     """Future cycles appear in chronological order (nearest start first)."""
-    from datetime import datetime, timezone
     now = datetime(2025, 2, 10, 12, 0, 0, tzinfo=timezone.utc)
     march = {"id": "m", "name": "March", "number": 3, "starts_at": "2025-03-01T00:00:00Z", "ends_at": "2025-03-14T23:59:59Z"}
     april = {"id": "a", "name": "April", "number": 4, "starts_at": "2025-04-01T00:00:00Z", "ends_at": "2025-04-14T23:59:59Z"}
@@ -352,6 +346,27 @@ def test_fetch_all_assigned_includes_stale_completed_when_for_backfill():
     assert ids_backfill == {"old", "act"}
 
 
+def test_fetch_all_assigned_issues_follows_cursor_and_keeps_page_order():
+    """Pages are prefetched one ahead; each request uses the previous endCursor and results stay in page order."""
+    def _node(i):
+        return {
+            "id": f"id-{i}", "identifier": f"LIN-{i}", "title": str(i), "url": "", "priority": 2,
+            "updatedAt": "2025-02-20T10:00:00.000Z", "description": "",
+            "state": {"id": "s1", "name": "In Progress", "type": "started"},
+            "team": {"name": "Eng"}, "labels": {"nodes": []},
+        }
+    pages = [
+        {"issues": {"nodes": [_node(1), _node(2)], "pageInfo": {"hasNextPage": True, "endCursor": "c1"}}},
+        {"issues": {"nodes": [_node(3)], "pageInfo": {"hasNextPage": True, "endCursor": "c2"}}},
+        {"issues": {"nodes": [_node(4)], "pageInfo": {"hasNextPage": False, "endCursor": None}}},
+    ]
+    with patch.object(app_module, "_linear_request", side_effect=pages) as mock_request:
+        result = app_module._fetch_all_assigned_issues("fake-token")
+    assert [n["identifier"] for n in result] == ["LIN-1", "LIN-2", "LIN-3", "LIN-4"]
+    cursors = [call[0][2].get("after") for call in mock_request.call_args_list]
+    assert cursors == [None, "c1", "c2"]
+
+
 def test_refresh_removes_priority_for_completed_and_rebalances(tmp_path):
     """On refresh, completed issues have their personal priority removed and list is rebalanced."""
     import json
@@ -567,3 +582,21 @@ def test_sort_team_alphabetical():
     result = app_module._apply_sort(issues, "team", "asc")
     assert [r["identifier"] for r in result] == ["LIN-a", "LIN-b", "LIN-c"]
     assert [r["team_name"] for r in result] == ["Team A", "Team B", "Team C"]
+
+
+def test_apply_filter_active_completed_return_independent_lists():
+    """active/completed filters hand back independent lists that track in-place changes to the input."""
+    issues = [
+        {"identifier": "LIN-1", "is_completed": False},
+        {"identifier": "LIN-2", "is_completed": True},
+        {"identifier": "LIN-3", "is_completed": False},
+    ]
+    active = app_module._apply_filter(issues, "active")
+    completed = app_module._apply_filter(issues, "completed")
+    assert [i["identifier"] for i in active] == ["LIN-1", "LIN-3"]
+    assert [i["identifier"] for i in completed] == ["LIN-2"]
+    active.clear()
+    assert len(app_module._apply_filter(issues, "active")) == 2
+    issues.append({"identifier": "LIN-4", "is_completed": False})
+    assert len(app_module._apply_filter(issues, "active")) == 3
+    assert len(app_module._apply_filter(issues, None)) == 4
@@ -237,12 +237,6 @@ def test_merge_site_defaults():
     assert "int-transporter" in m["github"]["repos"]
 
 
-@pytest.fixture
-def client():
-    app_module.app.config["TESTING"] = True
-    return app_module.app.test_client()
-
-
 def test_api_metrics_get_empty_store(client):
     """Flask test client: GET /api/metrics returns JSON shape."""
     resp = client.get("/api/metrics")
@@ -262,8 +256,7 @@ def test_api_settings_site_get_post(temp_overlay_path, client):
 
     resp2 = client.post(
         "/api/settings/site",
-        data=json.dumps({"github": {"org": "myorg", "repos": ["a"], "login": "me"}}),
-        content_type="application/json",
+        json={"github": {"org": "myorg", "repos": ["a"], "login": "me"}},
     )
     assert resp2.status_code == 200
     body = resp2.get_json()
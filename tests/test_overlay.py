@@ -2,18 +2,85 @@
 
 import copy
 import json
+import os
+import re
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 import app as app_module
 
 
+def _load_json(path):
+    """Parse a JSON file the app wrote: one read of the raw bytes, parsed with stdlib json (independent of the app's parser)."""
+    return json.loads(path.read_bytes())
+
+
 def test_read_missing_overlay_returns_empty_dict(temp_overlay_path_no_files):
     """Reading when no split files exist runs migration and returns empty merged overlay."""
     result = app_module.read_overlay()
     assert result == {}
 
 
+def test_read_corrupt_inprogress_returns_empty_dict(temp_overlay_path):
+    """A truncated or non-JSON inprogress.json reads as an empty overlay instead of raising."""
+    app_module.INPROGRESS_PATH.write_bytes(b'{"LIN-1": {"notes": ')
+    assert app_module.read_inprogress_overlay() == {}
+
+
+def test_read_overlay_sees_same_size_external_edit(temp_overlay_path):
+    """A hand edit that keeps the file's size and mtime is still read, and its duplicate priority resolved."""
+    app_module.write_overlay({"LIN-1": {"personal_priority": 1}, "LIN-2": {"personal_priority": 2}})
+    assert app_module.read_overlay()["LIN-2"]["personal_priority"] == 2
+    path = app_module.INPROGRESS_PATH
+    st = path.stat()
+    edited = path.read_bytes().replace(b'"personal_priority": 2', b'"personal_priority": 1')
+    assert len(edited) == st.st_size
+    path.write_bytes(edited)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert app_module.read_inprogress_overlay()["LIN-2"]["personal_priority"] == 1
+    result = app_module.read_overlay()
+    assert sorted(v["personal_priority"] for v in result.values()) == [1, 2]
+
+
+def test_read_overlay_returns_independent_copies(temp_overlay_path):
+    """Mutating a returned overlay does not leak into later reads."""
+    app_module.write_inprogress_overlay({"LIN-1": {"notes": "a"}})
+    first = app_module.read_inprogress_overlay()
+    first["LIN-1"]["notes"] = "mutated"
+    first["LIN-2"] = {}
+    assert app_module.read_inprogress_overlay() == {"LIN-1": {"notes": "a"}}
+
+
+def test_overlay_round_trip_without_orjson(temp_overlay_path, monkeypatch):
+    """With orjson unavailable, overlay files are still written and read via stdlib json."""
+    monkeypatch.setattr(app_module, "orjson", None)
+    app_module.write_inprogress_overlay({"LIN-1": {"notes": "caf\u00e9"}})
+    assert _load_json(app_module.INPROGRESS_PATH) == {"LIN-1": {"notes": "caf\u00e9"}}
+    assert app_module.read_inprogress_overlay() == {"LIN-1": {"notes": "caf\u00e9"}}
+
+
+def test_read_stdlib_written_lone_surrogate_keeps_every_entry(temp_overlay_path):
+    """A file orjson refuses to parse (stdlib-escaped lone surrogate) is read via json, so a later save keeps every note."""
+    app_module.INPROGRESS_PATH.write_bytes(json.dumps({"LIN-1": {"notes": "x\ud800"}, "LIN-2": {"notes": "b"}}).encode())
+    assert app_module.read_inprogress_overlay()["LIN-2"]["notes"] == "b"
+    app_module.write_overlay_entry("LIN-3", {"notes": "c"})
+    overlay = app_module.read_overlay()
+    assert overlay["LIN-1"]["notes"] == "x\ud800"
+    assert overlay["LIN-2"]["notes"] == "b"
+    assert overlay["LIN-3"]["notes"] == "c"
+
+
+def test_failed_overlay_write_leaves_previous_file_intact(temp_overlay_path):
+    """Writes go to a temp file and are swapped in with os.replace; a failure keeps the old file and cleans up."""
+    app_module.write_inprogress_overlay({"LIN-1": {"notes": "kept"}})
+    with patch.object(app_module.os, "replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            app_module.write_inprogress_overlay({"LIN-1": {"notes": "lost"}})
+    assert _load_json(app_module.INPROGRESS_PATH) == {"LIN-1": {"notes": "kept"}}
+    assert not list(temp_overlay_path.glob("*.tmp"))
+
+
 def test_write_entry_creates_file(temp_overlay_path):
     """Writing one entry creates inprogress.json with correct content."""
     app_module.write_overlay_entry("LIN-1", {
@@ -22,21 +89,21 @@ def test_write_entry_creates_file(temp_overlay_path):
         "notes": "Some notes",
     })
     assert app_module.INPROGRESS_PATH.exists()
-    with open(app_module.INPROGRESS_PATH, encoding="utf-8") as f:
-        data = json.load(f)
+    data = _load_json(app_module.INPROGRESS_PATH)
     assert "LIN-1" in data
     assert data["LIN-1"]["personal_priority"] == 2
     assert data["LIN-1"]["personal_status"] == "In Progress"
     assert data["LIN-1"]["notes"] == "Some notes"
     assert "last_updated" in data["LIN-1"]
+    # Stored as naive UTC seconds (no offset), matching existing overlay files
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}", data["LIN-1"]["last_updated"])
 
 
 @pytest.mark.parametrize("status", ["Testing", "Pair Testing", "Waiting on Testing", "Completed", "Canceled", "Meeting Scheduled", "Notable"])
 def test_write_entry_saves_new_personal_statuses(temp_overlay_path, status):
     """Personal status values including Completed and Notable can be saved without error."""
     app_module.write_overlay_entry("LIN-1", {"personal_status": status})
-    with open(app_module.INPROGRESS_PATH, encoding="utf-8") as f:
-        data = json.load(f)
+    data = _load_json(app_module.INPROGRESS_PATH)
     assert "LIN-1" in data
     assert data["LIN-1"]["personal_status"] == status
 
@@ -50,6 +117,21 @@ def test_write_second_entry_preserves_first(temp_overlay_path):
     assert overlay["LIN-2"]["notes"] == "Second"
 
 
+def test_write_entry_recreates_removed_data_dir(tmp_path, monkeypatch):
+    """If data/ is deleted while settings.json survives, the next entry write re-creates it instead of failing."""
+    monkeypatch.setattr(app_module, "SETTINGS_PATH", tmp_path / "config" / "settings.json")
+    monkeypatch.setattr(app_module, "INPROGRESS_PATH", tmp_path / "data" / "inprogress.json")
+    monkeypatch.setattr(app_module, "COMPLETED_PATH", tmp_path / "data" / "completed.json")
+    monkeypatch.setattr(app_module, "OVERLAY_LEGACY_PATH", tmp_path / "data" / "overlay.json")
+    monkeypatch.setattr(app_module, "OVERLAY_OLD_PATH", tmp_path / "data" / "overlay.old")
+    app_module.write_overlay_entry("LIN-1", {"notes": "First"})
+    for f in (tmp_path / "data").iterdir():
+        f.unlink()
+    (tmp_path / "data").rmdir()
+    app_module.write_overlay_entry("LIN-2", {"notes": "Second"})
+    assert app_module.read_overlay()["LIN-2"]["notes"] == "Second"
+
+
 def test_write_updates_existing_entry(temp_overlay_path):
     """Writing to an existing issue id updates that entry."""
     app_module.write_overlay_entry("LIN-1", {"notes": "Original"})
@@ -59,6 +141,26 @@ def test_write_updates_existing_entry(temp_overlay_path):
     assert overlay["LIN-1"]["notes"] == "Updated"
 
 
+def test_overlay_transaction_writes_only_changed_files(temp_overlay_path):
+    """overlay_transaction writes each split file at most once, and skips files whose contents did not change."""
+    with patch.object(app_module, "write_inprogress_overlay") as w_inprog, \
+            patch.object(app_module, "write_completed_overlay") as w_completed:
+        with app_module.overlay_transaction() as (inprog, completed):
+            inprog["LIN-1"] = {"notes": "a"}
+            inprog["LIN-1"]["notes"] = "b"
+    w_inprog.assert_called_once_with({"LIN-1": {"notes": "b"}})
+    w_completed.assert_not_called()
+
+
+def test_overlay_transaction_does_not_write_when_block_raises(temp_overlay_path):
+    """If the transaction body raises, neither overlay file is rewritten."""
+    with pytest.raises(RuntimeError):
+        with app_module.overlay_transaction() as (inprog, _completed):
+            inprog["LIN-1"] = {"notes": "lost"}
+            raise RuntimeError("boom")
+    assert app_module.read_inprogress_overlay() == {}
+
+
 def test_merge_with_missing_overlay_keys_uses_defaults():
     """Merging issues with no overlay entry yields defaults for overlay fields."""
     linear_issues = [
@@ -126,6 +228,36 @@ def test_rebalance_assign_n_when_n_taken():
     assert sorted(priorities) == list(range(1, len(priorities) + 1))
 
 
+def test_rebalance_assign_n_shifts_only_run_up_to_first_gap():
+    """When N is taken, only the contiguous run starting at N shifts; entries past the first free slot keep their priority."""
+    overlay = {
+        "LIN-1": {"personal_priority": 1},
+        "LIN-2": {"personal_priority": 2},
+        "LIN-3": {"personal_priority": 3},
+        "LIN-5": {"personal_priority": 5},
+    }
+    result = app_module.rebalance_overlay_after_assign(overlay, "LIN-9", 2)
+    assert result["LIN-9"]["personal_priority"] == 2
+    assert result["LIN-2"]["personal_priority"] == 3
+    assert result["LIN-3"]["personal_priority"] == 4
+    assert result["LIN-5"]["personal_priority"] == 5
+    assert result["LIN-1"]["personal_priority"] == 1
+
+
+def test_rebalance_assign_keeps_key_order_and_other_fields():
+    """The shift rewrites priorities in place: key order and non-priority fields come back unchanged."""
+    overlay = {
+        "LIN-3": {"personal_priority": 2, "notes": "c"},
+        "LIN-1": {"personal_priority": 1, "status": "Blocked"},
+        "LIN-2": {"notes": "no priority"},
+    }
+    result = app_module.rebalance_overlay_after_assign(overlay, "LIN-2", 1)
+    assert list(result) == ["LIN-3", "LIN-1", "LIN-2"]
+    assert result["LIN-3"] == {"personal_priority": 3, "notes": "c"}
+    assert result["LIN-1"] == {"personal_priority": 2, "status": "Blocked"}
+    assert result["LIN-2"] == {"notes": "no priority", "personal_priority": 1}
+
+
 def test_rebalance_assign_n_when_n_free():
     """Assigning priority N when N is free assigns directly with no other changes."""
     overlay = {
@@ -164,6 +296,19 @@ def test_rebalance_does_not_mutate_input():
     assert overlay == orig
 
 
+def test_rebalance_shift_does_not_mutate_input_entries():
+    """Shifting other entries' priorities works on copies; the caller's entry dicts are untouched."""
+    overlay = {
+        "LIN-1": {"personal_priority": 1, "notes": "a"},
+        "LIN-2": {"personal_priority": 2, "notes": "b"},
+    }
+    orig = copy.deepcopy(overlay)
+    app_module.rebalance_overlay_after_assign(overlay, "LIN-3", 1)
+    app_module.rebalance_overlay_after_remove(overlay, "LIN-1")
+    app_module.rebalance_overlay_after_remove_multiple(overlay, ["LIN-1", "LIN-2"])
+    assert overlay == orig
+
+
 def test_resolve_priority_conflicts_produces_contiguous():
     """If two entries share the same priority, resolve_priority_conflicts produces contiguous 1,2,3."""
     overlay = {
@@ -193,6 +338,22 @@ def test_read_overlay_resolves_conflicts_and_returns_contiguous(temp_overlay_pat
     assert sorted(priorities) == [1, 2]
 
 
+def test_read_overlay_checks_conflicts_on_every_read(temp_overlay_path):
+    """Conflict resolution runs on each read, so duplicates written between reads are always resolved."""
+    app_module.write_overlay({"LIN-1": {"personal_priority": 1}, "LIN-2": {"personal_priority": 2}})
+    with patch.object(app_module, "resolve_priority_conflicts", wraps=app_module.resolve_priority_conflicts) as spy:
+        app_module.read_overlay()
+        app_module.read_overlay()
+        assert spy.call_count == 2
+    app_module.write_overlay({
+        "LIN-1": {"personal_priority": 1, "last_updated": "2025-02-10T10:00:00"},
+        "LIN-2": {"personal_priority": 1, "last_updated": "2025-02-15T10:00:00"},
+    })
+    result = app_module.read_overlay()
+    assert result["LIN-2"]["personal_priority"] == 1
+    assert result["LIN-1"]["personal_priority"] == 2
+
+
 def test_change_existing_priority_rebalances():
     """Changing an issue's priority from K to N reassigns correctly and rebalances the rest."""
     overlay = {
@@ -242,8 +403,7 @@ def test_column_preferences_written_and_read(temp_overlay_path):
     vis["team"] = True
     app_module.write_column_preferences(order, vis)
     assert app_module.SETTINGS_PATH.exists()
-    with open(app_module.SETTINGS_PATH, encoding="utf-8") as f:
-        data = json.load(f)
+    data = _load_json(app_module.SETTINGS_PATH)
     assert app_module.COLUMN_PREFERENCES_KEY in data
     prefs = data[app_module.COLUMN_PREFERENCES_KEY]
     assert prefs["order"] == order
@@ -301,6 +461,25 @@ def test_hidden_columns_retain_position_in_order(temp_overlay_path):
     assert read_prefs2["order"].index("cycle") == cycle_idx
 
 
+def test_write_column_preferences_rejects_incomplete_order(temp_overlay_path):
+    """An order missing a registry ID (or naming an unknown one) raises ValueError and writes nothing."""
+    vis = dict(app_module.DEFAULT_COLUMN_VISIBILITY)
+    before = app_module.SETTINGS_PATH.read_bytes()
+    with pytest.raises(ValueError):
+        app_module.write_column_preferences(app_module.DEFAULT_COLUMN_ORDER[:-1], vis)
+    with pytest.raises(ValueError):
+        app_module.write_column_preferences(app_module.DEFAULT_COLUMN_ORDER[:-1] + ["bogus"], vis)
+    assert app_module.SETTINGS_PATH.read_bytes() == before
+
+
+def test_write_column_preferences_drops_unknown_visibility_keys(temp_overlay_path):
+    """Visibility keys that are not registry IDs are not persisted."""
+    vis = {**app_module.DEFAULT_COLUMN_VISIBILITY, "bogus": True}
+    app_module.write_column_preferences(app_module.DEFAULT_COLUMN_ORDER, vis)
+    stored = _load_json(app_module.SETTINGS_PATH)[app_module.COLUMN_PREFERENCES_KEY]["visibility"]
+    assert set(stored) == set(app_module.DEFAULT_COLUMN_ORDER)
+
+
 def test_column_preferences_migration_from_legacy(temp_overlay_path_no_files):
     """Legacy overlay.json with column_visibility is migrated to settings.json + inprogress; overlay renamed to overlay.old."""
     legacy = {
@@ -314,21 +493,31 @@ def test_column_preferences_migration_from_legacy(temp_overlay_path_no_files):
     assert prefs["visibility"]["cycle"] is True
     assert prefs["visibility"]["team"] is False
     assert app_module.SETTINGS_PATH.exists()
-    with open(app_module.SETTINGS_PATH, encoding="utf-8") as f:
-        data = json.load(f)
+    data = _load_json(app_module.SETTINGS_PATH)
     assert app_module.COLUMN_PREFERENCES_KEY in data
     assert app_module.COLUMN_VISIBILITY_KEY not in data
     assert not app_module.OVERLAY_LEGACY_PATH.exists()
     assert app_module.OVERLAY_OLD_PATH.exists()
-    with open(app_module.INPROGRESS_PATH, encoding="utf-8") as f:
-        inprog = json.load(f)
+    inprog = _load_json(app_module.INPROGRESS_PATH)
     assert "LIN-1" in inprog
     assert inprog["LIN-1"]["notes"] == "x"
-    with open(app_module.COMPLETED_PATH, encoding="utf-8") as f:
-        completed = json.load(f)
+    completed = _load_json(app_module.COMPLETED_PATH)
     assert completed == {}
 
 
+def test_migration_creates_dirs_for_current_paths(tmp_path, monkeypatch):
+    """ensure_migrated creates the parent directories of the configured paths, not the module's default config/ and data/."""
+    monkeypatch.setattr(app_module, "SETTINGS_PATH", tmp_path / "cfg" / "settings.json")
+    monkeypatch.setattr(app_module, "INPROGRESS_PATH", tmp_path / "overlay" / "inprogress.json")
+    monkeypatch.setattr(app_module, "COMPLETED_PATH", tmp_path / "overlay" / "completed.json")
+    app_module.ensure_migrated()
+    assert app_module.SETTINGS_PATH.exists()
+    assert app_module.INPROGRESS_PATH.exists()
+    assert app_module.COMPLETED_PATH.exists()
+    assert not (tmp_path / "config").exists()
+    assert not (tmp_path / "data").exists()
+
+
 def test_migration_idempotent(temp_overlay_path_no_files):
     """Running migration twice does not overwrite or re-rename; overlay.old stays."""
     legacy = {"LIN-1": {"notes": "x"}, app_module.COLUMN_PREFERENCES_KEY: {"order": list(app_module.DEFAULT_COLUMN_ORDER), "visibility": {c["id"]: c["default_visible"] for c in app_module.COLUMN_REGISTRY}}}
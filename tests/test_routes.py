@@ -1,11 +1,18 @@
 """Unit tests for Flask routes."""
 
 import json
+import types
 import pytest
 from unittest.mock import patch, MagicMock
 
 import app as app_module
 
+# Column IDs in registry order and their default visibility, computed once for the column config tests
+_COL_IDS = tuple(c["id"] for c in app_module.COLUMN_REGISTRY)
+_DEFAULT_VIS = {c["id"]: c["default_visible"] for c in app_module.COLUMN_REGISTRY}
+# Keys every issue returned by /api/issues must carry
+_REQUIRED_ISSUE_KEYS = frozenset({"identifier", "title", "linear_status", "linear_priority", "personal_priority", "notes"})
+
 
 def _sample_raw_linear_node():
     return {
@@ -49,35 +56,38 @@ def _raw_issue(
     }
 
 
+# Default Linear response for route tests; a tuple so no test can mutate the shared nodes list.
+_DEFAULT_LINEAR_NODES = (_sample_raw_linear_node(),)
+
+
 @pytest.fixture
-def mock_linear_fetch():
-    """Mock _fetch_all_assigned_issues and get_linear_token so no real API calls are made."""
-    with patch.object(app_module, "get_linear_token", return_value="test-token"):
-        with patch.object(app_module, "_fetch_all_assigned_issues", return_value=[_sample_raw_linear_node()]) as m:
-            yield m
+def mock_linear_fetch(monkeypatch):
+    """Mock _fetch_all_assigned_issues and get_linear_token so no real API calls are made.
+    Plain monkeypatch attribute swaps, undone after each test; the mock returns a fresh copy of the default nodes."""
+    m = MagicMock(return_value=list(_DEFAULT_LINEAR_NODES))
+    monkeypatch.setattr(app_module, "get_linear_token", lambda: "test-token")
+    monkeypatch.setattr(app_module, "_fetch_all_assigned_issues", m)
+    return m
 
 
-def test_get_landing_returns_200():
+def test_get_landing_returns_200(client):
     """GET / returns landing page HTML."""
-    client = app_module.app.test_client()
     resp = client.get("/")
     assert resp.status_code == 200
     assert "text/html" in resp.content_type
     assert b"Sidecar" in resp.data
 
 
-def test_get_dashboard_returns_200():
+def test_get_dashboard_returns_200(client):
     """GET /dashboard returns ticket dashboard HTML."""
-    client = app_module.app.test_client()
     resp = client.get("/dashboard")
     assert resp.status_code == 200
     assert "text/html" in resp.content_type
-    assert b"My Linear Dashboard" in resp.data or b"Linear" in resp.data
+    assert b"Linear" in resp.data
 
 
-def test_get_api_issues_returns_json_with_expected_shape(mock_linear_fetch):
+def test_get_api_issues_returns_json_with_expected_shape(client, mock_linear_fetch):
     """GET /api/issues returns JSON with issues list and last_fetched; each issue has expected keys."""
-    client = app_module.app.test_client()
     resp = client.get("/api/issues")
     assert resp.status_code == 200
     data = resp.get_json()
@@ -86,25 +96,30 @@ def test_get_api_issues_returns_json_with_expected_shape(mock_linear_fetch):
     issues = data["issues"]
     assert isinstance(issues, list)
     assert len(issues) == 1
-    issue = issues[0]
-    for key in ("identifier", "title", "linear_status", "linear_priority", "personal_priority", "notes"):
-        assert key in issue
+    assert _REQUIRED_ISSUE_KEYS <= issues[0].keys()
 
 
-def test_get_api_issues_when_fetch_fails_returns_400():
+def test_get_api_issues_same_body_without_orjson(client, mock_linear_fetch):
+    """With orjson unavailable, /api/issues falls back to Flask's JSON provider and decodes to the same payload."""
+    fast = client.get("/api/issues")
+    with patch.object(app_module, "orjson", None):
+        slow = client.get("/api/issues")
+    assert fast.mimetype == slow.mimetype == "application/json"
+    assert fast.get_json() == slow.get_json()
+
+
+def test_get_api_issues_when_fetch_fails_returns_400(client, monkeypatch):
     """GET /api/issues when Linear fetch raises (e.g. no token) returns 400 with error message."""
     app_module._issues_cache = None
-    with patch.object(app_module, "get_linear_token", side_effect=ValueError("LINEAR_GRAPHQL_API is not set")):
-        client = app_module.app.test_client()
-        resp = client.get("/api/issues")
-        assert resp.status_code == 400
-        data = resp.get_json()
-        assert "error" in data
+    monkeypatch.setattr(app_module, "get_linear_token", MagicMock(side_effect=ValueError("LINEAR_GRAPHQL_API is not set")))
+    resp = client.get("/api/issues")
+    assert resp.status_code == 400
+    data = resp.get_json()
+    assert "error" in data
 
 
-def test_post_api_refresh_returns_updated_issues(mock_linear_fetch):
+def test_post_api_refresh_returns_updated_issues(client, mock_linear_fetch):
     """POST /api/refresh triggers fetch and returns issues with last_fetched and refresh_detail."""
-    client = app_module.app.test_client()
     resp = client.post("/api/refresh", json={})
     assert resp.status_code == 200
     data = resp.get_json()
@@ -117,13 +132,11 @@ def test_post_api_refresh_returns_updated_issues(mock_linear_fetch):
     mock_linear_fetch.assert_called()
 
 
-def test_post_api_overlay_saves_and_returns_success(temp_overlay_path, mock_linear_fetch):
+def test_post_api_overlay_saves_and_returns_success(client, temp_overlay_path):
     """POST /api/overlay/<issue_id> with valid body saves to overlay and returns 200."""
-    client = app_module.app.test_client()
     resp = client.post(
         "/api/overlay/LIN-99",
-        data=json.dumps({"personal_priority": 1, "personal_status": "Blocked", "notes": "My note"}),
-        content_type="application/json",
+        json={"personal_priority": 1, "personal_status": "Blocked", "notes": "My note"},
     )
     assert resp.status_code == 200
     data = resp.get_json()
@@ -132,32 +145,49 @@ def test_post_api_overlay_saves_and_returns_success(temp_overlay_path, mock_line
     assert data["entry"]["notes"] == "My note"
     assert data["entry"]["personal_status"] == "Blocked"
     assert data["entry"]["personal_priority"] == 1
-    assert app_module.INPROGRESS_PATH.exists()
-    with open(app_module.INPROGRESS_PATH, encoding="utf-8") as f:
-        overlay = json.load(f)
-    assert "LIN-99" in overlay
+    # The response echoes the entry; the file read is what proves it was persisted
+    overlay = json.loads(app_module.INPROGRESS_PATH.read_bytes())
     assert overlay["LIN-99"]["notes"] == "My note"
 
 
-def test_post_api_overlay_whitespace_issue_id_returns_400():
+@pytest.mark.parametrize("body", [
+    {"personal_priority": 10**20},
+    {"notes": "x\ud800"},
+], ids=["priority-beyond-64-bit", "lone-surrogate-note"])
+def test_post_api_overlay_saves_values_orjson_rejects(client, temp_overlay_path, body):
+    """Values orjson refuses to serialize are still saved via the stdlib fallback instead of returning 500."""
+    app_module.write_overlay({"LIN-1": {"notes": "keep me"}})
+    resp = client.post("/api/overlay/LIN-99", json=body)
+    assert resp.status_code == 200
+    overlay = app_module.read_overlay()
+    assert overlay["LIN-1"]["notes"] == "keep me"
+    assert "LIN-99" in overlay
+
+
+def test_get_api_issues_with_lone_surrogate_note(client, temp_overlay_path, mock_linear_fetch):
+    """GET /api/issues falls back to Flask's JSON provider when orjson refuses the merged payload."""
+    app_module.write_overlay({"LIN-1": {"notes": "x\ud800"}})
+    resp = client.get("/api/issues")
+    assert resp.status_code == 200
+    assert resp.get_json()["issues"][0]["notes"] == "x\ud800"
+
+
+def test_post_api_overlay_whitespace_issue_id_returns_400(client):
     """POST /api/overlay/ with only-whitespace issue_id returns 400 (overlay key becomes empty)."""
-    client = app_module.app.test_client()
     resp = client.post(
         "/api/overlay/   ",
-        data=json.dumps({"notes": "x"}),
-        content_type="application/json",
+        json={"notes": "x"},
     )
     assert resp.status_code == 400
     assert resp.get_json().get("error") == "Invalid issue_id"
 
 
-def test_get_api_issues_filter_active_returns_only_non_completed(mock_linear_fetch):
+def test_get_api_issues_filter_active_returns_only_non_completed(client, mock_linear_fetch):
     """GET /api/issues?filter=active returns only issues with is_completed false."""
     mock_linear_fetch.return_value = [
         _raw_issue("u1", "LIN-1", "Active", linear_priority=2, linear_status="In Progress", state_type="started"),
         _raw_issue("u2", "LIN-2", "Done", linear_priority=2, linear_status="Done", state_type="completed"),
     ]
-    client = app_module.app.test_client()
     resp = client.get("/api/issues?filter=active")
     assert resp.status_code == 200
     issues = resp.get_json()["issues"]
@@ -166,13 +196,12 @@ def test_get_api_issues_filter_active_returns_only_non_completed(mock_linear_fet
     assert issues[0]["is_completed"] is False
 
 
-def test_get_api_issues_filter_completed_returns_only_completed(mock_linear_fetch):
+def test_get_api_issues_filter_completed_returns_only_completed(client, mock_linear_fetch):
     """GET /api/issues?filter=completed returns only completed/cancelled issues."""
     mock_linear_fetch.return_value = [
         _raw_issue("u1", "LIN-1", "Active", linear_priority=2, linear_status="In Progress", state_type="started"),
         _raw_issue("u2", "LIN-2", "Done", linear_priority=2, linear_status="Done", state_type="completed"),
     ]
-    client = app_module.app.test_client()
     resp = client.get("/api/issues?filter=completed")
     assert resp.status_code == 200
     issues = resp.get_json()["issues"]
@@ -181,18 +210,18 @@ def test_get_api_issues_filter_completed_returns_only_completed(mock_linear_fetc
     assert issues[0]["is_completed"] is True
 
 
-def test_post_overlay_conflicting_priority_triggers_rebalancing(temp_overlay_path, mock_linear_fetch):
+@pytest.fixture
+def seeded_overlay(temp_overlay_path):
+    """In-progress overlay with LIN-1 at personal priority 1, seeded with one write_overlay call (no setup POST)."""
+    app_module.write_overlay({"LIN-1": {"personal_priority": 1, "notes": "first"}})
+    return temp_overlay_path
+
+
+def test_post_overlay_conflicting_priority_triggers_rebalancing(client, seeded_overlay):
     """POST /api/overlay/<id> with a priority that another issue has triggers insert-mode rebalancing."""
-    client = app_module.app.test_client()
-    client.post(
-        "/api/overlay/LIN-1",
-        data=json.dumps({"personal_priority": 1, "notes": "first"}),
-        content_type="application/json",
-    )
     resp = client.post(
         "/api/overlay/LIN-2",
-        data=json.dumps({"personal_priority": 1, "notes": "new first"}),
-        content_type="application/json",
+        json={"personal_priority": 1, "notes": "new first"},
     )
     assert resp.status_code == 200
     data = resp.get_json()
@@ -203,23 +232,12 @@ def test_post_overlay_conflicting_priority_triggers_rebalancing(temp_overlay_pat
     assert data["overlay"]["LIN-2"]["personal_priority"] == 1
 
 
-def test_post_overlay_priority_response_has_full_rebalanced_overlay(temp_overlay_path, mock_linear_fetch):
+def test_post_overlay_priority_response_has_full_rebalanced_overlay(client, temp_overlay_path):
     """Response after a priority update reflects the full rebalanced priority list."""
-    client = app_module.app.test_client()
-    client.post(
-        "/api/overlay/LIN-1",
-        data=json.dumps({"personal_priority": 1}),
-        content_type="application/json",
-    )
-    client.post(
-        "/api/overlay/LIN-2",
-        data=json.dumps({"personal_priority": 2}),
-        content_type="application/json",
-    )
+    app_module.write_overlay({"LIN-1": {"personal_priority": 1}, "LIN-2": {"personal_priority": 2}})
     resp = client.post(
         "/api/overlay/LIN-3",
-        data=json.dumps({"personal_priority": 2}),
-        content_type="application/json",
+        json={"personal_priority": 2},
     )
     assert resp.status_code == 200
     data = resp.get_json()
@@ -230,38 +248,40 @@ def test_post_overlay_priority_response_has_full_rebalanced_overlay(temp_overlay
     assert overlay["LIN-1"]["personal_priority"] == 1
 
 
-def test_post_overlay_rebalance_writes_once(temp_overlay_path, mock_linear_fetch):
+def test_post_overlay_priority_resolves_existing_duplicates(client, temp_overlay_path):
+    """A priority save on an overlay that already has duplicate priorities resolves them in the response and on disk."""
+    app_module.write_overlay({
+        "LIN-1": {"personal_priority": 1, "last_updated": "2025-02-10T10:00:00"},
+        "LIN-2": {"personal_priority": 1, "last_updated": "2025-02-15T10:00:00"},
+    })
+    resp = client.post("/api/overlay/LIN-3", json={"personal_priority": 5})
+    assert resp.status_code == 200
+    data = resp.get_json()
+    priorities = {k: v["personal_priority"] for k, v in data["overlay"].items()}
+    assert priorities == {"LIN-1": 3, "LIN-2": 2, "LIN-3": 1}
+    assert data["entry"]["personal_priority"] == 1
+    saved = json.loads(app_module.INPROGRESS_PATH.read_bytes())
+    assert {k: v["personal_priority"] for k, v in saved.items()} == priorities
+
+
+def test_post_overlay_rebalance_writes_once(client, seeded_overlay):
     """When POST causes rebalancing, write_inprogress_overlay is called once."""
-    from unittest.mock import patch
-    client = app_module.app.test_client()
-    client.post(
-        "/api/overlay/LIN-1",
-        data=json.dumps({"personal_priority": 1}),
-        content_type="application/json",
-    )
     with patch.object(app_module, "write_inprogress_overlay") as mock_write:
         resp = client.post(
             "/api/overlay/LIN-2",
-            data=json.dumps({"personal_priority": 1}),
-            content_type="application/json",
+            json={"personal_priority": 1},
         )
     assert resp.status_code == 200
     mock_write.assert_called_once()
 
 
-def test_post_overlay_move_to_last_does_not_push_down(temp_overlay_path, mock_linear_fetch):
+def test_post_overlay_move_to_last_does_not_push_down(client, temp_overlay_path):
     """Moving an issue to last position (e.g. 4 to 9) via API produces contiguous 1..9, not 10."""
-    mock_linear_fetch.return_value = [
-        _raw_issue(f"u{i}", f"LIN-{i}", f"Issue {i}", linear_priority=2, linear_status="X")
-        for i in range(1, 10)
-    ]
     overlay = {f"LIN-{i}": {"personal_priority": i, "notes": ""} for i in range(1, 10)}
-    app_module.INPROGRESS_PATH.write_text(json.dumps(overlay))
-    client = app_module.app.test_client()
+    app_module.write_overlay(overlay)
     resp = client.post(
         "/api/overlay/LIN-4",
-        data=json.dumps({"personal_priority": 9}),
-        content_type="application/json",
+        json={"personal_priority": 9},
     )
     assert resp.status_code == 200
     data = resp.get_json()
@@ -272,21 +292,19 @@ def test_post_overlay_move_to_last_does_not_push_down(temp_overlay_path, mock_li
     assert max(priorities) == 9
 
 
-def test_post_overlay_invalidates_cache_so_get_issues_sees_update(temp_overlay_path, mock_linear_fetch):
+def test_post_overlay_invalidates_cache_so_get_issues_sees_update(client, temp_overlay_path, mock_linear_fetch):
     """After POST /api/overlay saves a change, next GET /api/issues returns fresh data (cache invalidated)."""
     mock_linear_fetch.return_value = [
         _raw_issue("u1", "LIN-1", "One", linear_priority=2, linear_status="X"),
         _raw_issue("u2", "LIN-2", "Two", linear_priority=2, linear_status="X"),
     ]
-    app_module.INPROGRESS_PATH.write_text(json.dumps({"LIN-1": {"personal_priority": 1}}))
-    client = app_module.app.test_client()
+    app_module.write_overlay({"LIN-1": {"personal_priority": 1}})
     # Populate cache
     client.get("/api/issues")
     # Change overlay: remove LIN-1's priority
     resp = client.post(
         "/api/overlay/LIN-1",
-        data=json.dumps({"personal_priority": None}),
-        content_type="application/json",
+        json={"personal_priority": None},
     )
     assert resp.status_code == 200
     # Next GET must re-read overlay from disk (cache was invalidated), so LIN-1 has no priority
@@ -300,174 +318,81 @@ def test_post_overlay_invalidates_cache_so_get_issues_sees_update(temp_overlay_p
 
 # --- apply_issue_filters and API filter param tests ---
 
-def _merged_issues_fixture():
-    """List of merged issues for filter tests (varied updated_at, status, priority, personal fields)."""
-    return [
-        {
-            "id": "u1", "identifier": "LIN-1", "title": "One",
-            "linear_status": "In Progress", "linear_priority": 2,
-            "updated_at": "2025-02-10T10:00:00Z", "personal_priority": 1,
-            "personal_status": "Blocked", "last_updated": "2025-02-09T12:00:00Z",
-            "is_completed": False,
-        },
-        {
-            "id": "u2", "identifier": "LIN-2", "title": "Two",
-            "linear_status": "Done", "linear_priority": 1,
-            "updated_at": "2025-02-20T10:00:00Z", "personal_priority": None,
-            "personal_status": "", "last_updated": None,
-            "is_completed": False,
-        },
-        {
-            "id": "u3", "identifier": "LIN-3", "title": "Three",
-            "linear_status": "Todo", "linear_priority": 4,
-            "updated_at": "2025-02-25T10:00:00Z", "personal_priority": 2,
-            "personal_status": "In Progress", "last_updated": "2025-02-24T10:00:00Z",
-            "is_completed": False,
-        },
-        {
-            "id": "u4", "identifier": "LIN-4", "title": "Four",
-            "linear_status": "In Progress", "linear_priority": 0,
-            "updated_at": "2025-02-15T10:00:00Z", "personal_priority": None,
-            "personal_status": "Ready to Close", "last_updated": None,
-            "is_completed": False,
-        },
-    ]
-
-
-def test_apply_issue_filters_empty_config_returns_all():
-    """apply_issue_filters with empty config returns all issues."""
-    issues = _merged_issues_fixture()
-    result = app_module.apply_issue_filters(issues, {})
-    assert len(result) == len(issues)
-    result = app_module.apply_issue_filters(issues, None)
-    assert len(result) == len(issues)
-
-
-def test_apply_issue_filters_date_from():
-    """Filter by date_from: issues updated on or after that date."""
-    issues = _merged_issues_fixture()
-    result = app_module.apply_issue_filters(issues, {"date_from": "2025-02-20"})
-    assert len(result) == 2
-    ids = {i["identifier"] for i in result}
-    assert "LIN-2" in ids
-    assert "LIN-3" in ids
-    assert "LIN-1" not in ids
-
-
-def test_apply_issue_filters_date_to():
-    """Filter by date_to: issues updated on or before that date."""
-    issues = _merged_issues_fixture()
-    result = app_module.apply_issue_filters(issues, {"date_to": "2025-02-15"})
-    assert len(result) == 2
-    ids = {i["identifier"] for i in result}
-    assert "LIN-1" in ids
-    assert "LIN-4" in ids
-
-
-def test_apply_issue_filters_date_range_both():
-    """Filter by date_from and date_to: inclusive range."""
-    issues = _merged_issues_fixture()
-    result = app_module.apply_issue_filters(issues, {"date_from": "2025-02-12", "date_to": "2025-02-22"})
-    assert len(result) == 2
-    ids = {i["identifier"] for i in result}
-    assert "LIN-2" in ids
-    assert "LIN-4" in ids
-    assert "LIN-1" not in ids
-    assert "LIN-3" not in ids
-
-
-def test_apply_issue_filters_date_neither():
-    """No date filter when neither date_from nor date_to set."""
-    issues = _merged_issues_fixture()
-    result = app_module.apply_issue_filters(issues, {"linear_statuses": ["In Progress"]})
-    assert len(result) == 2
-    result2 = app_module.apply_issue_filters(issues, {})
-    assert len(result2) == 4
-
-
-def test_apply_issue_filters_linear_status_single():
-    """Filter by single Linear status."""
-    issues = _merged_issues_fixture()
-    result = app_module.apply_issue_filters(issues, {"linear_statuses": ["Done"]})
-    assert len(result) == 1
-    assert result[0]["identifier"] == "LIN-2"
-
-
-def test_apply_issue_filters_linear_status_multiple():
-    """Filter by multiple Linear statuses."""
-    issues = _merged_issues_fixture()
-    result = app_module.apply_issue_filters(issues, {"linear_statuses": ["In Progress", "Todo"]})
-    assert len(result) == 3
-    ids = {i["identifier"] for i in result}
-    assert "LIN-1" in ids
-    assert "LIN-3" in ids
-    assert "LIN-4" in ids
-    assert "LIN-2" not in ids
-
-
-def test_apply_issue_filters_linear_status_none_selected():
-    """No status filter when list empty."""
-    issues = _merged_issues_fixture()
-    result = app_module.apply_issue_filters(issues, {"linear_statuses": []})
-    assert len(result) == 4
-
-
-def test_apply_issue_filters_linear_priority_single():
-    """Filter by single Linear priority."""
-    issues = _merged_issues_fixture()
-    result = app_module.apply_issue_filters(issues, {"linear_priorities": [1]})
-    assert len(result) == 1
-    assert result[0]["identifier"] == "LIN-2"
-
-
-def test_apply_issue_filters_linear_priority_multiple():
-    """Filter by multiple Linear priorities."""
-    issues = _merged_issues_fixture()
-    result = app_module.apply_issue_filters(issues, {"linear_priorities": [0, 2]})
-    assert len(result) == 2
-    ids = {i["identifier"] for i in result}
-    assert "LIN-1" in ids
-    assert "LIN-4" in ids
-
-
-def test_apply_issue_filters_personal_priority_set():
-    """Filter personal_priority_filter=set: only issues with personal_priority set."""
-    issues = _merged_issues_fixture()
-    result = app_module.apply_issue_filters(issues, {"personal_priority_filter": "set"})
-    assert len(result) == 2
-    ids = {i["identifier"] for i in result}
-    assert "LIN-1" in ids
-    assert "LIN-3" in ids
-
-
-def test_apply_issue_filters_personal_priority_unset():
-    """Filter personal_priority_filter=unset: only issues with no personal_priority."""
-    issues = _merged_issues_fixture()
-    result = app_module.apply_issue_filters(issues, {"personal_priority_filter": "unset"})
-    assert len(result) == 2
-    ids = {i["identifier"] for i in result}
-    assert "LIN-2" in ids
-    assert "LIN-4" in ids
-
-
-def test_apply_issue_filters_personal_priority_all():
-    """personal_priority_filter=all applies no filter."""
-    issues = _merged_issues_fixture()
-    result = app_module.apply_issue_filters(issues, {"personal_priority_filter": "all"})
-    assert len(result) == 4
-
-
-def test_apply_issue_filters_personal_status():
-    """Filter by personal status (one or more)."""
-    issues = _merged_issues_fixture()
-    result = app_module.apply_issue_filters(issues, {"personal_statuses": ["Blocked"]})
-    assert len(result) == 1
-    assert result[0]["identifier"] == "LIN-1"
-    result2 = app_module.apply_issue_filters(issues, {"personal_statuses": ["", "In Progress"]})
-    assert len(result2) == 2
-    ids = {i["identifier"] for i in result2}
-    assert "LIN-2" in ids  # No status (empty string)
-    assert "LIN-3" in ids
+# Merged issues for filter tests (varied updated_at, status, priority, personal fields). Built once at import as
+# read-only views: apply_issue_filters only reads the entries, and a test that mutates one fails loudly.
+_MERGED_ISSUES = tuple(types.MappingProxyType(d) for d in (
+    {
+        "id": "u1", "identifier": "LIN-1", "title": "One",
+        "linear_status": "In Progress", "linear_priority": 2,
+        "updated_at": "2025-02-10T10:00:00Z", "personal_priority": 1,
+        "personal_status": "Blocked", "last_updated": "2025-02-09T12:00:00Z",
+        "is_completed": False,
+    },
+    {
+        "id": "u2", "identifier": "LIN-2", "title": "Two",
+        "linear_status": "Done", "linear_priority": 1,
+        "updated_at": "2025-02-20T10:00:00Z", "personal_priority": None,
+        "personal_status": "", "last_updated": None,
+        "is_completed": False,
+    },
+    {
+        "id": "u3", "identifier": "LIN-3", "title": "Three",
+        "linear_status": "Todo", "linear_priority": 4,
+        "updated_at": "2025-02-25T10:00:00Z", "personal_priority": 2,
+        "personal_status": "In Progress", "last_updated": "2025-02-24T10:00:00Z",
+        "is_completed": False,
+    },
+    {
+        "id": "u4", "identifier": "LIN-4", "title": "Four",
+        "linear_status": "In Progress", "linear_priority": 0,
+        "updated_at": "2025-02-15T10:00:00Z", "personal_priority": None,
+        "personal_status": "Ready to Close", "last_updated": None,
+        "is_completed": False,
+    },
+))
+
+
+@pytest.fixture(scope="module")
+def merged_issues():
+    """The shared read-only filter-test issues; a test that needs to mutate one must copy it with dict() first."""
+    return _MERGED_ISSUES
+
+
+@pytest.mark.parametrize("config, expected_ids", [
+    pytest.param(None, {"LIN-1", "LIN-2", "LIN-3", "LIN-4"}, id="none_config_returns_all"),
+    pytest.param({}, {"LIN-1", "LIN-2", "LIN-3", "LIN-4"}, id="empty_config_returns_all"),
+    # updated_at on or after / on or before the bound (inclusive)
+    pytest.param({"date_from": "2025-02-20"}, {"LIN-2", "LIN-3"}, id="date_from"),
+    pytest.param({"date_to": "2025-02-15"}, {"LIN-1", "LIN-4"}, id="date_to"),
+    pytest.param({"date_from": "2025-02-12", "date_to": "2025-02-22"}, {"LIN-2", "LIN-4"}, id="date_range_both"),
+    # an unparseable bound is ignored while the valid one still applies
+    pytest.param({"date_from": "not-a-date", "date_to": "2025-02-15"}, {"LIN-1", "LIN-4"}, id="invalid_date_bound_is_ignored"),
+    pytest.param({"linear_statuses": ["In Progress"]}, {"LIN-1", "LIN-4"}, id="date_neither"),
+    pytest.param({"linear_statuses": ["Done"]}, {"LIN-2"}, id="linear_status_single"),
+    pytest.param({"linear_statuses": ["In Progress", "Todo"]}, {"LIN-1", "LIN-3", "LIN-4"}, id="linear_status_multiple"),
+    pytest.param({"linear_statuses": []}, {"LIN-1", "LIN-2", "LIN-3", "LIN-4"}, id="linear_status_none_selected"),
+    pytest.param({"linear_priorities": [1]}, {"LIN-2"}, id="linear_priority_single"),
+    pytest.param({"linear_priorities": [0, 2]}, {"LIN-1", "LIN-4"}, id="linear_priority_multiple"),
+    pytest.param({"personal_priority_filter": "set"}, {"LIN-1", "LIN-3"}, id="personal_priority_set"),
+    pytest.param({"personal_priority_filter": "unset"}, {"LIN-2", "LIN-4"}, id="personal_priority_unset"),
+    pytest.param({"personal_priority_filter": "all"}, {"LIN-1", "LIN-2", "LIN-3", "LIN-4"}, id="personal_priority_all"),
+    pytest.param({"personal_statuses": ["Blocked"]}, {"LIN-1"}, id="personal_status_single"),
+    # "" matches issues with no personal status
+    pytest.param({"personal_statuses": ["", "In Progress"]}, {"LIN-2", "LIN-3"}, id="personal_status_including_empty"),
+    # filters combine with AND
+    pytest.param(
+        {"date_from": "2025-02-09", "linear_statuses": ["In Progress"], "personal_priority_filter": "set"},
+        {"LIN-1"},
+        id="and_logic",
+    ),
+    pytest.param({"linear_statuses": ["Done"], "personal_priority_filter": "set"}, set(), id="no_matches_returns_empty"),
+])
+def test_apply_issue_filters(merged_issues, config, expected_ids):
+    """apply_issue_filters returns a list holding exactly the issues matching every criterion in config."""
+    result = app_module.apply_issue_filters(merged_issues, config)
+    assert isinstance(result, list)
+    assert {i["identifier"] for i in result} == expected_ids
+    assert len(result) == len(expected_ids)
 
 
 def test_apply_issue_filters_personal_status_new_statuses():
@@ -491,103 +416,60 @@ def test_apply_issue_filters_personal_status_new_statuses():
     assert result_waiting[0]["identifier"] == "LIN-3"
 
 
-def test_apply_issue_filters_and_logic():
-    """Multiple filters combined with AND: only issues matching all criteria."""
-    issues = _merged_issues_fixture()
-    # LIN-1: updated 2025-02-10, In Progress, personal_priority set -> use date_from 2025-02-09 to include it
-    result = app_module.apply_issue_filters(issues, {
-        "date_from": "2025-02-09",
-        "linear_statuses": ["In Progress"],
-        "personal_priority_filter": "set",
-    })
-    assert len(result) == 1
-    assert result[0]["identifier"] == "LIN-1"
-
-
-def test_apply_issue_filters_no_matches_returns_empty():
-    """Filter combination that matches no issues returns empty list, not error."""
-    issues = _merged_issues_fixture()
-    result = app_module.apply_issue_filters(issues, {
-        "linear_statuses": ["Done"],
-        "personal_priority_filter": "set",
-    })
-    assert len(result) == 0
-    assert isinstance(result, list)
-
-
-def test_get_api_issues_filter_date_from(mock_linear_fetch):
-    """GET /api/issues?date_from=... returns only issues updated on or after date."""
-    mock_linear_fetch.return_value = [
-        _raw_issue("u1", "LIN-1", "A", linear_priority=2, updated_at="2025-02-10T10:00:00.000Z", linear_status="X"),
-        _raw_issue("u2", "LIN-2", "B", linear_priority=2, updated_at="2025-02-20T10:00:00.000Z", linear_status="Y"),
-    ]
-    client = app_module.app.test_client()
-    resp = client.get("/api/issues?filter=active&date_from=2025-02-15")
-    assert resp.status_code == 200
-    issues = resp.get_json()["issues"]
-    assert len(issues) == 1
-    assert issues[0]["identifier"] == "LIN-2"
-
-
-def test_get_api_issues_filter_linear_status(mock_linear_fetch):
-    """GET /api/issues?linear_status=In Progress returns only that status."""
-    mock_linear_fetch.return_value = [
-        _raw_issue("u1", "LIN-1", "A", linear_priority=2, linear_status="In Progress"),
-        _raw_issue("u2", "LIN-2", "B", linear_priority=2, linear_status="Done"),
-    ]
-    client = app_module.app.test_client()
-    resp = client.get("/api/issues?filter=active&linear_status=In%20Progress")
-    assert resp.status_code == 200
-    issues = resp.get_json()["issues"]
-    assert len(issues) == 1
-    assert issues[0]["identifier"] == "LIN-1"
-
-
-def test_get_api_issues_filter_linear_priority(mock_linear_fetch):
-    """GET /api/issues?linear_priority=1 returns only that priority."""
-    mock_linear_fetch.return_value = [
-        _raw_issue("u1", "LIN-1", "A", linear_priority=1, linear_status="X"),
-        _raw_issue("u2", "LIN-2", "B", linear_priority=2, linear_status="X"),
-    ]
-    client = app_module.app.test_client()
-    resp = client.get("/api/issues?filter=active&linear_priority=1")
-    assert resp.status_code == 200
-    issues = resp.get_json()["issues"]
-    assert len(issues) == 1
-    assert issues[0]["identifier"] == "LIN-1"
-
-
-def test_get_api_issues_filter_personal_priority_set(mock_linear_fetch, temp_overlay_path):
-    """GET /api/issues?personal_priority_filter=set returns only issues with personal priority."""
-    mock_linear_fetch.return_value = [
-        _raw_issue("u1", "LIN-1", "A", linear_priority=2, linear_status="X"),
-        _raw_issue("u2", "LIN-2", "B", linear_priority=2, linear_status="X"),
-    ]
-    app_module.INPROGRESS_PATH.write_text(json.dumps({"LIN-1": {"personal_priority": 1}}))
-    client = app_module.app.test_client()
-    resp = client.get("/api/issues?filter=active&personal_priority_filter=set")
-    assert resp.status_code == 200
-    issues = resp.get_json()["issues"]
-    assert len(issues) == 1
-    assert issues[0]["identifier"] == "LIN-1"
-
-
-def test_get_api_issues_filter_no_matches_returns_200_empty_list(mock_linear_fetch):
-    """When filters match no issues, API returns 200 with issues: []."""
-    mock_linear_fetch.return_value = [
-        _raw_issue("u1", "LIN-1", "A", linear_priority=2, linear_status="Todo"),
-    ]
-    client = app_module.app.test_client()
-    resp = client.get("/api/issues?filter=active&linear_status=Done")
+@pytest.mark.parametrize("linear_nodes, overlay, query, expected_ids", [
+    pytest.param(
+        [
+            _raw_issue("u1", "LIN-1", "A", linear_priority=2, updated_at="2025-02-10T10:00:00.000Z", linear_status="X"),
+            _raw_issue("u2", "LIN-2", "B", linear_priority=2, updated_at="2025-02-20T10:00:00.000Z", linear_status="Y"),
+        ],
+        None, "date_from=2025-02-15", ["LIN-2"],
+        id="date_from",
+    ),
+    pytest.param(
+        [
+            _raw_issue("u1", "LIN-1", "A", linear_priority=2, linear_status="In Progress"),
+            _raw_issue("u2", "LIN-2", "B", linear_priority=2, linear_status="Done"),
+        ],
+        None, "linear_status=In%20Progress", ["LIN-1"],
+        id="linear_status",
+    ),
+    pytest.param(
+        [
+            _raw_issue("u1", "LIN-1", "A", linear_priority=1, linear_status="X"),
+            _raw_issue("u2", "LIN-2", "B", linear_priority=2, linear_status="X"),
+        ],
+        None, "linear_priority=1", ["LIN-1"],
+        id="linear_priority",
+    ),
+    pytest.param(
+        [
+            _raw_issue("u1", "LIN-1", "A", linear_priority=2, linear_status="X"),
+            _raw_issue("u2", "LIN-2", "B", linear_priority=2, linear_status="X"),
+        ],
+        {"LIN-1": {"personal_priority": 1}}, "personal_priority_filter=set", ["LIN-1"],
+        id="personal_priority_set",
+    ),
+    # No matches is still 200, with an empty issues list
+    pytest.param(
+        [_raw_issue("u1", "LIN-1", "A", linear_priority=2, linear_status="Todo")],
+        None, "linear_status=Done", [],
+        id="no_matches_returns_200_empty_list",
+    ),
+])
+def test_get_api_issues_filter_param(client, mock_linear_fetch, temp_overlay_path, linear_nodes, overlay, query, expected_ids):
+    """GET /api/issues?filter=active&<query> returns 200 with only the issues matching the filter params."""
+    mock_linear_fetch.return_value = linear_nodes
+    if overlay is not None:
+        app_module.write_overlay(overlay)
+    resp = client.get(f"/api/issues?filter=active&{query}")
     assert resp.status_code == 200
     data = resp.get_json()
-    assert data["issues"] == []
     assert "last_fetched" in data
+    assert [i["identifier"] for i in data["issues"]] == expected_ids
 
 
-def test_get_api_personal_status_options_includes_new_statuses_in_order():
+def test_get_api_personal_status_options_includes_new_statuses_in_order(client):
     """GET /api/personal-status-options returns all statuses including Completed, Canceled, Meeting Scheduled, Notable in correct display order."""
-    client = app_module.app.test_client()
     resp = client.get("/api/personal-status-options")
     assert resp.status_code == 200
     opts = resp.get_json()
@@ -612,13 +494,11 @@ def test_get_api_personal_status_options_includes_new_statuses_in_order():
     assert idx_notable > idx_canceled
 
 
-def test_post_api_overlay_invalid_personal_status_returns_400(temp_overlay_path, mock_linear_fetch):
+def test_post_api_overlay_invalid_personal_status_returns_400(client, temp_overlay_path):
     """POST /api/overlay/<id> with invalid personal_status returns 400 and error message."""
-    client = app_module.app.test_client()
     resp = client.post(
         "/api/overlay/LIN-1",
-        data=json.dumps({"personal_status": "Invalid Status"}),
-        content_type="application/json",
+        json={"personal_status": "Invalid Status"},
     )
     assert resp.status_code == 400
     data = resp.get_json()
@@ -629,9 +509,8 @@ def test_post_api_overlay_invalid_personal_status_returns_400(temp_overlay_path,
 # --- GET/POST /api/config/columns ---
 
 
-def test_get_api_config_columns_returns_registry_order_visibility(temp_overlay_path):
+def test_get_api_config_columns_returns_registry_order_visibility(client, temp_overlay_path):
     """GET /api/config/columns returns column registry, order, and visibility (fresh install)."""
-    client = app_module.app.test_client()
     resp = client.get("/api/config/columns")
     assert resp.status_code == 200
     data = resp.get_json()
@@ -659,11 +538,9 @@ def test_get_api_config_columns_returns_registry_order_visibility(temp_overlay_p
     assert vis.get("labels") is False
 
 
-def test_post_api_config_columns_persists_order_and_visibility(temp_overlay_path):
+def test_post_api_config_columns_persists_order_and_visibility(client, temp_overlay_path):
     """POST /api/config/columns with valid order and visibility persists and returns them."""
-    client = app_module.app.test_client()
-    order = [c["id"] for c in app_module.COLUMN_REGISTRY]
-    order = [order[1], order[0]] + order[2:]
+    order = [_COL_IDS[1], _COL_IDS[0], *_COL_IDS[2:]]
     new_vis = {
         "identifier": True,
         "title": True,
@@ -680,63 +557,54 @@ def test_post_api_config_columns_persists_order_and_visibility(temp_overlay_path
     }
     resp = client.post(
         "/api/config/columns",
-        data=json.dumps({"order": order, "visibility": new_vis}),
-        content_type="application/json",
+        json={"order": order, "visibility": new_vis},
     )
     assert resp.status_code == 200
     data = resp.get_json()
     assert data["order"] == order
     assert data["visibility"].get("cycle") is True
     assert app_module.SETTINGS_PATH.exists()
-    with open(app_module.SETTINGS_PATH, encoding="utf-8") as f:
-        settings = json.load(f)
+    settings = json.loads(app_module.SETTINGS_PATH.read_bytes())
     assert app_module.COLUMN_PREFERENCES_KEY in settings
     assert settings[app_module.COLUMN_PREFERENCES_KEY]["order"] == order
     assert settings[app_module.COLUMN_PREFERENCES_KEY]["visibility"]["cycle"] is True
 
 
-def test_post_api_config_columns_duplicate_order_returns_400(temp_overlay_path):
+def test_post_api_config_columns_duplicate_order_returns_400(client, temp_overlay_path):
     """POST /api/config/columns with duplicate column ID in order returns 400."""
-    client = app_module.app.test_client()
-    order = [c["id"] for c in app_module.COLUMN_REGISTRY]
-    order = list(order)
+    order = list(_COL_IDS)
     order[0] = order[1]
-    vis = {c["id"]: c["default_visible"] for c in app_module.COLUMN_REGISTRY}
+    vis = dict(_DEFAULT_VIS)
     resp = client.post(
         "/api/config/columns",
-        data=json.dumps({"order": order, "visibility": vis}),
-        content_type="application/json",
+        json={"order": order, "visibility": vis},
     )
     assert resp.status_code == 400
     data = resp.get_json()
     assert "error" in data
 
 
-def test_post_api_config_columns_missing_order_returns_400(temp_overlay_path):
+def test_post_api_config_columns_missing_order_returns_400(client, temp_overlay_path):
     """POST /api/config/columns with missing column ID in order returns 400."""
-    client = app_module.app.test_client()
-    order = [c["id"] for c in app_module.COLUMN_REGISTRY][1:]
-    vis = {c["id"]: c["default_visible"] for c in app_module.COLUMN_REGISTRY}
+    order = list(_COL_IDS[1:])
+    vis = dict(_DEFAULT_VIS)
     resp = client.post(
         "/api/config/columns",
-        data=json.dumps({"order": order, "visibility": vis}),
-        content_type="application/json",
+        json={"order": order, "visibility": vis},
     )
     assert resp.status_code == 400
     data = resp.get_json()
     assert "error" in data
 
 
-def test_post_api_config_columns_rejects_hiding_identifier(temp_overlay_path):
+def test_post_api_config_columns_rejects_hiding_identifier(client, temp_overlay_path):
     """POST /api/config/columns with identifier false returns 400."""
-    client = app_module.app.test_client()
-    order = [c["id"] for c in app_module.COLUMN_REGISTRY]
-    vis = {c["id"]: c["default_visible"] for c in app_module.COLUMN_REGISTRY}
+    order = list(_COL_IDS)
+    vis = dict(_DEFAULT_VIS)
     vis["identifier"] = False
     resp = client.post(
         "/api/config/columns",
-        data=json.dumps({"order": order, "visibility": vis}),
-        content_type="application/json",
+        json={"order": order, "visibility": vis},
     )
     assert resp.status_code == 400
     data = resp.get_json()
@@ -744,16 +612,14 @@ def test_post_api_config_columns_rejects_hiding_identifier(temp_overlay_path):
     assert "identifier" in data["error"].lower()
 
 
-def test_post_api_config_columns_rejects_hiding_title(temp_overlay_path):
+def test_post_api_config_columns_rejects_hiding_title(client, temp_overlay_path):
     """POST /api/config/columns with title false returns 400."""
-    client = app_module.app.test_client()
-    order = [c["id"] for c in app_module.COLUMN_REGISTRY]
-    vis = {c["id"]: c["default_visible"] for c in app_module.COLUMN_REGISTRY}
+    order = list(_COL_IDS)
+    vis = dict(_DEFAULT_VIS)
     vis["title"] = False
     resp = client.post(
         "/api/config/columns",
-        data=json.dumps({"order": order, "visibility": vis}),
-        content_type="application/json",
+        json={"order": order, "visibility": vis},
     )
     assert resp.status_code == 400
     data = resp.get_json()
@@ -761,34 +627,26 @@ def test_post_api_config_columns_rejects_hiding_title(temp_overlay_path):
     assert "title" in data["error"].lower()
 
 
-def test_post_api_config_columns_rejects_only_identifier_title_visible(temp_overlay_path):
+def test_post_api_config_columns_rejects_only_identifier_title_visible(client, temp_overlay_path):
     """POST /api/config/columns that would leave only identifier and title visible returns 400."""
-    client = app_module.app.test_client()
-    order = [c["id"] for c in app_module.COLUMN_REGISTRY]
-    only_two = {
-        c["id"]: (c["id"] in ("identifier", "title"))
-        for c in app_module.COLUMN_REGISTRY
-    }
+    order = list(_COL_IDS)
+    only_two = {cid: cid in ("identifier", "title") for cid in _COL_IDS}
     resp = client.post(
         "/api/config/columns",
-        data=json.dumps({"order": order, "visibility": only_two}),
-        content_type="application/json",
+        json={"order": order, "visibility": only_two},
     )
     assert resp.status_code == 400
     data = resp.get_json()
     assert "error" in data
 
 
-def test_filter_order_matches_column_order_after_reorder(temp_overlay_path):
+def test_filter_order_matches_column_order_after_reorder(client, temp_overlay_path):
     """After POST with custom order, GET returns that order (filter popover can follow column order)."""
-    client = app_module.app.test_client()
-    order = [c["id"] for c in app_module.COLUMN_REGISTRY]
-    order = [order[2], order[0], order[1]] + order[3:]
-    vis = {c["id"]: c["default_visible"] for c in app_module.COLUMN_REGISTRY}
+    order = [_COL_IDS[2], _COL_IDS[0], _COL_IDS[1], *_COL_IDS[3:]]
+    vis = dict(_DEFAULT_VIS)
     resp = client.post(
         "/api/config/columns",
-        data=json.dumps({"order": order, "visibility": vis}),
-        content_type="application/json",
+        json={"order": order, "visibility": vis},
     )
     assert resp.status_code == 200
     resp2 = client.get("/api/config/columns")